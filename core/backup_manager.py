@@ -1,20 +1,177 @@
 import os
+import re
+import sys
 import shutil
-import subprocess
 import tempfile
 import zipfile
 import tarfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
 import hashlib
+import posixpath
+import gzip
+import zlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+try:
+    from isal import igzip, isal_zlib
+except ImportError:
+    igzip = None
+    isal_zlib = None
+
+_COMPRESSION_LEVEL = 6
+_STREAM_CHUNK_SIZE = 1 << 20
+_PRECOMPRESS_LIMIT = 64 * 1024 * 1024
+_MAX_PENDING_BYTES = 4 * _PRECOMPRESS_LIMIT
+_ZIP_INTERNALS_OK = (3, 8) <= sys.version_info[:2] <= (3, 13) and hasattr(zipfile.ZipFile, '_writecheck')
+_BACKUP_EXTS = ('.zip', '.tar.gz')
+_WINDOWS_RESTORE_ROOTS = {
+    'config': 'C:\\Windows\\System32\\config',
+    'Boot': 'C:\\Windows\\Boot',
+    'drivers': 'C:\\Windows\\System32\\drivers',
+    'Start Menu': 'C:\\ProgramData\\Microsoft\\Windows\\Start Menu',
+    'Users': 'C:\\Users'
+}
+_SKIPPED_REPORT_LIMIT = 100
+_MAX_POOL_WORKERS = 61 if os.name == 'nt' else None
+_UNIX_RESTORE_ROOTS = {
+    'etc': '/etc',
+    'boot': '/boot',
+    'home': '/home'
+}
+_TAR_EXTRACT_OPTIONS = {'filter': 'fully_trusted'} if hasattr(tarfile, 'fully_trusted_filter') else {}
+_JUNK_PATTERN = re.compile(r'(?:^|/)(?:\.cache|node_modules|Trash)(?:/|$)|\.sock$')
+_FADV_DONTNEED = getattr(os, 'POSIX_FADV_DONTNEED', None)
+_ZIP_MAGICS = (b'PK\x03\x04', b'PK\x05\x06')
+_GZIP_MAGIC = b'\x1f\x8b'
+
+def _compress_bytes(data: bytes) -> bytes:
+    if deflate is not None:
+        return deflate.deflate_compress(data, _COMPRESSION_LEVEL)
+    
+    if isal_zlib is not None:
+        compressor = isal_zlib.compressobj(isal_zlib.ISAL_DEFAULT_COMPRESSION, isal_zlib.DEFLATED, -15)
+    else:
+        compressor = zlib.compressobj(_COMPRESSION_LEVEL, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+def _open_gzip_writer(path: str):
+    if igzip is not None:
+        return igzip.open(path, 'wb', compresslevel=isal_zlib.ISAL_DEFAULT_COMPRESSION)
+    return gzip.open(path, 'wb', compresslevel=_COMPRESSION_LEVEL)
+
+def _open_gzip_reader(path: str):
+    if igzip is not None:
+        return igzip.open(path, 'rb')
+    return gzip.open(path, 'rb')
+
+def _write_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes, 
+                         crc: int, file_size: int):
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(data)
+    
+    with zipf._lock:
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zipf.fp.write(zinfo.FileHeader())
+        zipf.fp.write(data)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+def _deflate_file(file_path: str) -> Optional[Tuple[bytes, int, int]]:
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            data = f.read()
+    except PermissionError:
+        return None
+    
+    return _compress_bytes(data), zlib.crc32(data), len(data)
+
+def _drop_cached_pages(fd: int):
+    if _FADV_DONTNEED is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, _FADV_DONTNEED)
+    except OSError:
+        pass
+
+def _flush_and_drop_cached_pages(path: str):
+    if _FADV_DONTNEED is None:
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        _drop_cached_pages(fd)
+    finally:
+        os.close(fd)
+
+class _UncachedTarFile(tarfile.TarFile):
+    def addfile(self, tarinfo, fileobj=None):
+        super().addfile(tarinfo, fileobj)
+        if fileobj is not None and hasattr(fileobj, 'fileno'):
+            _drop_cached_pages(fileobj.fileno())
+
+def _skip_junk(tarinfo: tarfile.TarInfo) -> Optional[tarfile.TarInfo]:
+    if _JUNK_PATTERN.search(tarinfo.name):
+        return None
+    return tarinfo
+
+@lru_cache(maxsize=256)
+def _sniff_format(backup_path: str, mtime_ns: int) -> Optional[str]:
+    try:
+        with open(backup_path, 'rb', buffering=0) as f:
+            magic = f.read(6)
+    except OSError:
+        return None
+    
+    if magic.startswith(_ZIP_MAGICS):
+        return 'zip'
+    if magic.startswith(_GZIP_MAGIC):
+        return 'tar.gz'
+    return None
+
+def _sniff(backup_path: str) -> Optional[str]:
+    try:
+        mtime_ns = os.stat(backup_path).st_mtime_ns
+    except OSError:
+        return None
+    return _sniff_format(backup_path, mtime_ns)
+
+def _verify_backup_file(backup_path: str) -> Dict:
+    return BackupManager().verify_backup(backup_path)
 
 class BackupManager:
     def __init__(self):
         self.backup_directory = os.path.join(tempfile.gettempdir(), "detorrent_backups")
         self.active_backups = {}
         self.backup_metadata = {}
+        self.compression_workers = min(os.cpu_count() or 1, _MAX_POOL_WORKERS or sys.maxsize)
+        
+        if os.name == 'nt':
+            self._do_create_backup = self._create_windows_backup
+            self._do_restore_backup = self._restore_windows_backup
+        else:
+            self._do_create_backup = self._create_unix_backup
+            self._do_restore_backup = self._restore_unix_backup
         
     def create_system_backup(self, backup_path: str) -> Dict:
         try:
@@ -31,10 +188,7 @@ class BackupManager:
             
             self.active_backups[backup_id] = backup_info
             
-            if os.name == 'nt':
-                result = self._create_windows_backup(backup_path, backup_id)
-            else:
-                result = self._create_unix_backup(backup_path, backup_id)
+            result = self._do_create_backup(backup_path, backup_id)
             
             if result['success']:
                 backup_info['status'] = 'completed'
@@ -63,26 +217,78 @@ class BackupManager:
             
             backup_file = os.path.join(backup_path, f"{backup_id}.zip")
             
-            with zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for item in backup_items:
-                    if os.path.exists(item):
-                        if os.path.isfile(item):
-                            zipf.write(item, os.path.basename(item))
-                        else:
-                            for root, dirs, files in os.walk(item):
-                                for file in files:
-                                    try:
-                                        file_path = os.path.join(root, file)
-                                        arcname = os.path.relpath(file_path, item)
-                                        zipf.write(file_path, arcname)
-                                    except PermissionError:
-                                        continue
+            with open(backup_file, 'wb', buffering=_STREAM_CHUNK_SIZE) as raw:
+                with zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                    if _ZIP_INTERNALS_OK:
+                        self._write_entries_parallel(zipf, backup_items)
+                    else:
+                        self._write_entries_serial(zipf, backup_items)
             
             return {'success': True, 'backup_file': backup_file}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _write_entries_parallel(self, zipf: zipfile.ZipFile, backup_items: List[str]):
+        with _process_pool(self.compression_workers) as executor:
+            pending = deque()
+            pending_bytes = 0
+            
+            for file_path, arcname in self._iter_backup_files(backup_items):
+                try:
+                    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+                    if zinfo.file_size > _PRECOMPRESS_LIMIT:
+                        self._write_large_entry(zipf, zinfo, file_path)
+                        continue
+                except PermissionError:
+                    continue
+                
+                pending.append((zinfo, executor.submit(_deflate_file, file_path)))
+                pending_bytes += zinfo.file_size
+                while pending_bytes > _MAX_PENDING_BYTES:
+                    zinfo, future = pending.popleft()
+                    pending_bytes -= zinfo.file_size
+                    self._write_pending_entry(zipf, zinfo, future)
+            
+            while pending:
+                self._write_pending_entry(zipf, *pending.popleft())
+    
+    def _write_entries_serial(self, zipf: zipfile.ZipFile, backup_items: List[str]):
+        for file_path, arcname in self._iter_backup_files(backup_items):
+            try:
+                self._write_large_entry(zipf, zipfile.ZipInfo.from_file(file_path, arcname), file_path)
+            except PermissionError:
+                continue
+    
+    def _iter_backup_files(self, backup_items: List[str]) -> Iterator[Tuple[str, str]]:
+        for item in backup_items:
+            if not os.path.exists(item):
+                continue
+            
+            item_name = os.path.basename(item)
+            if os.path.isfile(item):
+                yield item, item_name
+                continue
+            
+            for root, dirs, files in os.walk(item):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    yield file_path, os.path.join(item_name, os.path.relpath(file_path, item))
+    
+    def _write_large_entry(self, zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, file_path: str):
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        with open(file_path, 'rb', buffering=0) as src:
+            with zipf.open(zinfo, 'w') as dest:
+                shutil.copyfileobj(src, dest, _STREAM_CHUNK_SIZE)
+    
+    def _write_pending_entry(self, zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, future: Future):
+        result = future.result()
+        if result is None:
+            return
+        
+        data, crc, file_size = result
+        _write_precompressed(zipf, zinfo, data, crc, file_size)
+    
     def _create_unix_backup(self, backup_path: str, backup_id: str) -> Dict:
         try:
             backup_items = [
@@ -95,10 +301,14 @@ class BackupManager:
             
             backup_file = os.path.join(backup_path, f"{backup_id}.tar.gz")
             
-            with tarfile.open(backup_file, 'w:gz') as tarf:
-                for item in backup_items:
-                    if os.path.exists(item):
-                        tarf.add(item, arcname=os.path.basename(item))
+            with _open_gzip_writer(backup_file) as gzf:
+                with _UncachedTarFile.open(fileobj=gzf, mode='w|', bufsize=_STREAM_CHUNK_SIZE, 
+                                           copybufsize=_STREAM_CHUNK_SIZE) as tarf:
+                    for item in backup_items:
+                        if os.path.exists(item):
+                            tarf.add(item, arcname=os.path.basename(item), filter=_skip_junk)
+            
+            _flush_and_drop_cached_pages(backup_file)
             
             return {'success': True, 'backup_file': backup_file}
             
@@ -114,81 +324,112 @@ class BackupManager:
             if not backup_files:
                 return {'success': False, 'error': 'No backup files found'}
             
-            latest_backup = max(backup_files, key=os.path.getmtime)
+            latest_backup = max(backup_files, key=lambda entry: entry.stat().st_mtime_ns)
             
-            if os.name == 'nt':
-                result = self._restore_windows_backup(latest_backup)
-            else:
-                result = self._restore_unix_backup(latest_backup)
-            
-            return result
+            return self._do_restore_backup(latest_backup.path)
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
-    def _find_backup_files(self, backup_path: str) -> List[str]:
-        backup_files = []
-        
-        for file in os.listdir(backup_path):
-            if file.endswith(('.zip', '.tar.gz')):
-                backup_files.append(os.path.join(backup_path, file))
-        
-        return backup_files
+    def _find_backup_files(self, backup_path: str) -> List[os.DirEntry]:
+        with os.scandir(backup_path) as entries:
+            return [entry for entry in entries 
+                    if entry.name.endswith(_BACKUP_EXTS) and entry.is_file(follow_symlinks=False)]
     
     def _restore_windows_backup(self, backup_file: str) -> Dict:
         try:
-            if not backup_file.endswith('.zip'):
+            if _sniff(backup_file) != 'zip':
                 return {'success': False, 'error': 'Invalid backup file format'}
             
-            temp_extract_dir = tempfile.mkdtemp(prefix="detorrent_restore_")
-            
+            restored = 0
+            skipped = []
             with zipfile.ZipFile(backup_file, 'r') as zipf:
-                zipf.extractall(temp_extract_dir)
-            
-            restore_commands = [
-                f'robocopy "{temp_extract_dir}" "C:\\Windows\\System32\\config" /E /Y',
-                f'robocopy "{temp_extract_dir}" "C:\\Windows\\Boot" /E /Y',
-                f'robocopy "{temp_extract_dir}" "C:\\Users" /E /Y'
-            ]
-            
-            for command in restore_commands:
-                result = subprocess.run(command, shell=True, capture_output=True, text=True)
-                if result.returncode not in [0, 1]:
-                    return {'success': False, 'error': f'Restore command failed: {result.stderr}'}
-            
-            shutil.rmtree(temp_extract_dir, ignore_errors=True)
-            return {'success': True, 'message': 'Windows backup restored successfully'}
+                for info in zipf.infolist():
+                    target_root = self._restore_root_for(info.filename, _WINDOWS_RESTORE_ROOTS)
+                    if target_root is None:
+                        skipped.append(info.filename)
+                        continue
+                    
+                    try:
+                        zipf.extract(info, os.path.dirname(target_root))
+                    except OSError as e:
+                        return {'success': False, 'error': f'Restore failed: {e}'}
+                    restored += 1
+            
+            if skipped or not restored:
+                return {
+                    'success': False,
+                    'error': f'Restore incomplete: {restored} entries restored, {len(skipped)} skipped',
+                    'restored_count': restored,
+                    'skipped_count': len(skipped),
+                    'skipped': skipped[:_SKIPPED_REPORT_LIMIT]
+                }
+            
+            return {'success': True, 'message': 'Windows backup restored successfully', 'restored_count': restored}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def _restore_unix_backup(self, backup_file: str) -> Dict:
         try:
-            if not backup_file.endswith('.tar.gz'):
+            if _sniff(backup_file) != 'tar.gz':
                 return {'success': False, 'error': 'Invalid backup file format'}
             
-            temp_extract_dir = tempfile.mkdtemp(prefix="detorrent_restore_")
+            real_roots = tuple(os.path.realpath(root) for root in _UNIX_RESTORE_ROOTS.values())
+            safe_parents = set()
+            skipped = []
+            
+            with _open_gzip_reader(backup_file) as gzf:
+                with tarfile.open(fileobj=gzf, mode='r|', bufsize=_STREAM_CHUNK_SIZE) as tarf:
+                    for member in tarf:
+                        target_root = self._restore_root_for(member.name, _UNIX_RESTORE_ROOTS)
+                        if target_root is None:
+                            continue
+                        
+                        destination = os.path.dirname(target_root)
+                        parent = posixpath.dirname(member.name)
+                        if parent and parent not in safe_parents:
+                            if not self._within_roots(os.path.realpath(os.path.join(destination, parent)), real_roots):
+                                skipped.append(member.name)
+                                continue
+                            safe_parents.add(parent)
+                        
+                        if member.islnk() and (self._restore_root_for(member.linkname, _UNIX_RESTORE_ROOTS) is None or not 
+                                               self._within_roots(os.path.realpath(os.path.join(destination, member.linkname)), real_roots)):
+                            skipped.append(member.name)
+                            continue
+                        
+                        try:
+                            tarf.extract(member, destination, **_TAR_EXTRACT_OPTIONS)
+                        except OSError as e:
+                            return {'success': False, 'error': f'Restore failed: {e}'}
+                        
+                        if member.issym():
+                            safe_parents.clear()
+            
+            if skipped:
+                return {
+                    'success': True,
+                    'partial': True,
+                    'message': f'Unix backup restored with {len(skipped)} unsafe entries skipped',
+                    'skipped_count': len(skipped),
+                    'skipped': skipped[:_SKIPPED_REPORT_LIMIT]
+                }
             
-            with tarfile.open(backup_file, 'r:gz') as tarf:
-                tarf.extractall(temp_extract_dir)
-            
-            restore_commands = [
-                f'sudo cp -r "{temp_extract_dir}/etc" "/etc"',
-                f'sudo cp -r "{temp_extract_dir}/boot" "/boot"',
-                f'sudo cp -r "{temp_extract_dir}/home" "/home"'
-            ]
-            
-            for command in restore_commands:
-                result = subprocess.run(command.split(), capture_output=True, text=True)
-                if result.returncode != 0:
-                    return {'success': False, 'error': f'Restore command failed: {result.stderr}'}
-            
-            shutil.rmtree(temp_extract_dir, ignore_errors=True)
             return {'success': True, 'message': 'Unix backup restored successfully'}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _within_roots(self, path: str, roots: Tuple[str, ...]) -> bool:
+        return any(path == root or path.startswith(root + os.sep) for root in roots)
+    
+    def _restore_root_for(self, member_name: str, restore_roots: Dict[str, str]) -> Optional[str]:
+        parts = member_name.replace('\\', '/').split('/')
+        if not parts[0] or ':' in parts[0] or '..' in parts:
+            return None
+        return restore_roots.get(parts[0])
+    
     def list_backups(self, backup_directory: str = None) -> List[Dict]:
         try:
             if backup_directory is None:
@@ -199,14 +440,15 @@ class BackupManager:
             
             backups = []
             
-            for file in os.listdir(backup_directory):
-                if file.endswith(('.zip', '.tar.gz')):
-                    file_path = os.path.join(backup_directory, file)
-                    stat_info = os.stat(file_path)
+            with os.scandir(backup_directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_BACKUP_EXTS):
+                        continue
                     
+                    stat_info = entry.stat()
                     backup_info = {
-                        'name': file,
-                        'path': file_path,
+                        'name': entry.name,
+                        'path': entry.path,
                         'size': stat_info.st_size,
                         'created': datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
                         'modified': datetime.fromtimestamp(stat_info.st_mtime).isoformat()
@@ -230,14 +472,34 @@ class BackupManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def verify_all(self, backup_paths: List[str]) -> Dict[str, Dict]:
+        results = {}
+        if not backup_paths:
+            return results
+        
+        try:
+            with _process_pool(min(len(backup_paths), self.compression_workers)) as executor:
+                futures = {path: executor.submit(_verify_backup_file, path) for path in backup_paths}
+                for path, future in futures.items():
+                    try:
+                        results[path] = future.result()
+                    except Exception as e:
+                        results[path] = {'success': False, 'error': str(e)}
+        except Exception as e:
+            for path in backup_paths:
+                results.setdefault(path, {'success': False, 'error': str(e)})
+        
+        return results
+    
     def verify_backup(self, backup_path: str) -> Dict:
         try:
             if not os.path.exists(backup_path):
                 return {'success': False, 'error': 'Backup file does not exist'}
             
-            if backup_path.endswith('.zip'):
+            backup_format = _sniff(backup_path)
+            if backup_format == 'zip':
                 return self._verify_zip_backup(backup_path)
-            elif backup_path.endswith('.tar.gz'):
+            elif backup_format == 'tar.gz':
                 return self._verify_tar_backup(backup_path)
             else:
                 return {'success': False, 'error': 'Unsupported backup format'}
@@ -263,12 +525,15 @@ class BackupManager:
     
     def _verify_tar_backup(self, backup_path: str) -> Dict:
         try:
-            with tarfile.open(backup_path, 'r:gz') as tarf:
-                file_list = tarf.getnames()
+            file_count = 0
+            with _open_gzip_reader(backup_path) as gzf:
+                with tarfile.open(fileobj=gzf, mode='r|', bufsize=_STREAM_CHUNK_SIZE) as tarf:
+                    for _ in tarf:
+                        file_count += 1
             
             return {
                 'success': True,
-                'file_count': len(file_list),
+                'file_count': file_count,
                 'integrity': 'good'
             }
             
@@ -289,11 +554,13 @@ class BackupManager:
             cutoff_time = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
             deleted_count = 0
             
-            for file in os.listdir(backup_directory):
-                if file.endswith(('.zip', '.tar.gz')):
-                    file_path = os.path.join(backup_directory, file)
-                    if os.path.getmtime(file_path) < cutoff_time:
-                        os.remove(file_path)
+            with os.scandir(backup_directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_BACKUP_EXTS):
+                        continue
+                    
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
                         deleted_count += 1
             
             return {'success': True, 'message': f'Cleaned up {deleted_count} old backups'}
@@ -1,36 +1,78 @@
 import os
 import subprocess
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 class BootloaderManager:
     def __init__(self):
         self.bootloader_configs = {}
         self.grub_config_path = "/etc/grub.d"
         self.windows_boot_path = "C:\\Windows\\Boot"
+        self._batch_depth = 0
+        self._pending = set()
         
-    def configure_bootloader(self, target_partition: str) -> Dict:
+        if os.name == 'nt':
+            self._do_configure = self._configure_windows_bootloader
+            self._do_list_entries = self._list_windows_boot_entries
+            self._do_set_default = self._set_windows_default_entry
+            self._do_remove_entry = self._remove_windows_boot_entry
+        else:
+            self._do_configure = self._configure_grub_bootloader
+            self._do_list_entries = self._list_grub_boot_entries
+            self._do_set_default = self._set_grub_default_entry
+            self._do_remove_entry = self._remove_grub_boot_entry
+        
+    @contextmanager
+    def batch(self) -> Iterator[Dict]:
+        result = {'success': True}
+        self._batch_depth += 1
+        try:
+            yield result
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                self._pending.clear()
+                result.update(self._run_update_grub('Bootloader changes applied'))
+    
+    def _update_grub(self, message: str) -> Dict:
+        if self._batch_depth:
+            self._pending.add('update-grub')
+            return {'success': True, 'message': message, 'deferred': True}
+        
+        return self._run_update_grub(message)
+    
+    def _run_update_grub(self, message: str) -> Dict:
         try:
-            if os.name == 'nt':
-                return self._configure_windows_bootloader(target_partition)
+            result = subprocess.run([
+                'sudo', 'update-grub'
+            ], capture_output=True, text=True)
+            
+            if result.returncode == 0:
+                return {'success': True, 'message': message}
             else:
-                return self._configure_grub_bootloader(target_partition)
+                return {'success': False, 'error': result.stderr}
+                
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
+    def configure_bootloader(self, target_partition: str) -> Dict:
+        try:
+            return self._do_configure(target_partition)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def _configure_windows_bootloader(self, target_partition: str) -> Dict:
         try:
             bcd_commands = [
-                f'bcdedit /create /d "Detorrent OS" /application bootsector',
-                f'bcdedit /set {{bootmgr}} timeout 10',
-                f'bcdedit /set {{bootmgr}} displayorder {{default}}'
+                ['bcdedit', '/create', '/d', 'Detorrent OS', '/application', 'bootsector'],
+                ['bcdedit', '/set', '{bootmgr}', 'timeout', '10'],
+                ['bcdedit', '/set', '{bootmgr}', 'displayorder', '{default}']
             ]
             
             for command in bcd_commands:
-                result = subprocess.run([
-                    'powershell', '-Command', command
-                ], capture_output=True, text=True)
+                result = subprocess.run(command, capture_output=True, text=True)
                 
                 if result.returncode != 0:
                     return {'success': False, 'error': f'BCD command failed: {result.stderr}'}
@@ -50,14 +92,7 @@ class BootloaderManager:
             
             os.chmod(config_path, 0o755)
             
-            result = subprocess.run([
-                'sudo', 'update-grub'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return {'success': True, 'message': 'GRUB bootloader configured'}
-            else:
-                return {'success': False, 'error': result.stderr}
+            return self._update_grub('GRUB bootloader configured')
                 
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -75,18 +110,14 @@ menuentry 'Detorrent OS' {{
     
     def list_boot_entries(self) -> List[Dict]:
         try:
-            if os.name == 'nt':
-                return self._list_windows_boot_entries()
-            else:
-                return self._list_grub_boot_entries()
+            return self._do_list_entries()
         except Exception as e:
             return [{'error': str(e)}]
     
     def _list_windows_boot_entries(self) -> List[Dict]:
         try:
             result = subprocess.run([
-                'powershell', '-Command',
-                'bcdedit /enum | Select-String "description"'
+                'bcdedit', '/enum'
             ], capture_output=True, text=True)
             
             entries = []
@@ -121,18 +152,14 @@ menuentry 'Detorrent OS' {{
     
     def set_default_boot_entry(self, entry_name: str) -> Dict:
         try:
-            if os.name == 'nt':
-                return self._set_windows_default_entry(entry_name)
-            else:
-                return self._set_grub_default_entry(entry_name)
+            return self._do_set_default(entry_name)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def _set_windows_default_entry(self, entry_name: str) -> Dict:
         try:
             result = subprocess.run([
-                'powershell', '-Command',
-                f'bcdedit /set {{bootmgr}} default {entry_name}'
+                'bcdedit', '/set', '{bootmgr}', 'default', entry_name
             ], capture_output=True, text=True)
             
             if result.returncode == 0:
@@ -159,32 +186,21 @@ menuentry 'Detorrent OS' {{
             with open(grub_config_path, 'w') as f:
                 f.write('\n'.join(lines))
             
-            result = subprocess.run([
-                'sudo', 'update-grub'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return {'success': True, 'message': 'Default boot entry set'}
-            else:
-                return {'success': False, 'error': result.stderr}
+            return self._update_grub('Default boot entry set')
                 
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def remove_boot_entry(self, entry_name: str) -> Dict:
         try:
-            if os.name == 'nt':
-                return self._remove_windows_boot_entry(entry_name)
-            else:
-                return self._remove_grub_boot_entry(entry_name)
+            return self._do_remove_entry(entry_name)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def _remove_windows_boot_entry(self, entry_name: str) -> Dict:
         try:
             result = subprocess.run([
-                'powershell', '-Command',
-                f'bcdedit /delete {entry_name}'
+                'bcdedit', '/delete', entry_name
             ], capture_output=True, text=True)
             
             if result.returncode == 0:
@@ -201,14 +217,7 @@ menuentry 'Detorrent OS' {{
             if os.path.exists(config_path):
                 os.remove(config_path)
             
-            result = subprocess.run([
-                'sudo', 'update-grub'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                return {'success': True, 'message': 'Boot entry removed'}
-            else:
-                return {'success': False, 'error': result.stderr}
+            return self._update_grub('Boot entry removed')
                 
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -2,61 +2,198 @@ import os
 import subprocess
 import tempfile
 import shutil
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import hashlib
+import itertools
+import json
+import mmap
 import zipfile
 import tarfile
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+_CHECKSUM_ALGORITHM = 'blake3' if blake3 is not None else 'sha256'
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+_ISO_HEADER_SIZE = 2048
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_NOATIME_FLAG = getattr(os, 'O_NOATIME', 0)
+_ISO_EXTS = frozenset({'.iso', '.img', '.dmg', '.vdi', '.vmdk'})
+_CACHE_HOME = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+_CHECKSUM_CACHE_PATH = os.path.join(_CACHE_HOME, 'detorrent', 'iso_checksums.json')
+
+def _open_readonly(path: str) -> int:
+    if _NOATIME_FLAG:
+        try:
+            return os.open(path, _READ_FLAGS | _NOATIME_FLAG)
+        except PermissionError:
+            pass
+    
+    return os.open(path, _READ_FLAGS)
+
+def _checksum_fd(fd: int) -> str:
+    if blake3 is not None:
+        hasher = blake3(max_threads=blake3.AUTO)
+    else:
+        hasher = hashlib.sha256()
+    
+    if os.fstat(fd).st_size == 0:
+        return hasher.hexdigest()
+    
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+        if _MADV_SEQUENTIAL is not None:
+            mapped.madvise(_MADV_SEQUENTIAL)
+        hasher.update(mapped)
+    return hasher.hexdigest()
+
+def _is_valid_iso_header(header: bytes) -> bool:
+    if len(header) < _ISO_HEADER_SIZE:
+        return False
+    
+    return header[0:5] == b'CD001' or header[0:4] == b'\x00\x00\x00\x00'
+
+def _probe_iso_file(file_path: str) -> Tuple[str, bool]:
+    fd = _open_readonly(file_path)
+    try:
+        header = os.read(fd, _ISO_HEADER_SIZE)
+        return _checksum_fd(fd), _is_valid_iso_header(header)
+    finally:
+        os.close(fd)
+
 class IsoManager:
     def __init__(self):
         self.mounted_isos = {}
+        self._mount_ids = itertools.count()
         self.temp_directory = tempfile.mkdtemp(prefix="detorrent_iso_")
+        self.checksum_cache_path = _CHECKSUM_CACHE_PATH
+        self._checksum_cache = None
+        self._checksum_cache_dirty = False
+        
+        if os.name == 'nt':
+            self._mount_command = self._windows_mount_command
+            self._unmount_command = self._windows_unmount_command
+            self._install_command = self._windows_install_command
+        else:
+            self._mount_command = self._unix_mount_command
+            self._unmount_command = self._unix_unmount_command
+            self._install_command = self._unix_install_command
         
     def scan_directory(self, directory: str) -> List[Dict]:
         iso_files = []
-        directory_path = Path(directory)
         
-        if not directory_path.exists():
+        if not os.path.isdir(directory):
             return iso_files
         
-        for file_path in directory_path.rglob("*"):
-            if file_path.is_file() and self._is_iso_file(file_path):
-                iso_info = self._extract_iso_info(file_path)
+        for entry in self._iter_files(directory):
+            if self._is_iso_file(entry.name):
+                iso_info = self._extract_iso_info(entry)
                 iso_files.append(iso_info)
         
+        self._save_checksum_cache()
         return iso_files
     
-    def _is_iso_file(self, file_path: Path) -> bool:
-        iso_extensions = ['.iso', '.img', '.dmg', '.vdi', '.vmdk']
-        return file_path.suffix.lower() in iso_extensions
+    def _iter_files(self, directory: str) -> Iterator[os.DirEntry]:
+        pending = [directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
+    
+    def _is_iso_file(self, file_name: str) -> bool:
+        return os.path.splitext(file_name)[1].lower() in _ISO_EXTS
     
-    def _extract_iso_info(self, file_path: Path) -> Dict:
+    def _extract_iso_info(self, entry: os.DirEntry) -> Dict:
         try:
-            stat_info = file_path.stat()
+            stat_info = entry.stat()
+            checksum, structure_valid = self._cached_probe(entry.path, stat_info)
             return {
-                'path': str(file_path),
-                'name': file_path.name,
+                'path': entry.path,
+                'name': entry.name,
                 'size': stat_info.st_size,
                 'modified': stat_info.st_mtime,
-                'checksum': self._calculate_checksum(file_path)
+                'checksum': checksum,
+                'checksum_algorithm': _CHECKSUM_ALGORITHM,
+                'structure_valid': structure_valid
             }
         except Exception as e:
             return {
-                'path': str(file_path),
-                'name': file_path.name,
+                'path': entry.path,
+                'name': entry.name,
                 'size': 0,
                 'modified': 0,
                 'error': str(e)
             }
     
-    def _calculate_checksum(self, file_path: Path) -> str:
+    def _cached_probe(self, file_path: str, stat_info: os.stat_result) -> Tuple[str, bool]:
+        cache = self._load_checksum_cache()
+        cached = cache.get(file_path)
+        if (cached and cached.get('size') == stat_info.st_size 
+                and cached.get('mtime_ns') == stat_info.st_mtime_ns 
+                and cached.get('algorithm') == _CHECKSUM_ALGORITHM 
+                and 'structure_valid' in cached):
+            return cached['checksum'], cached['structure_valid']
+        
+        checksum, structure_valid = self._probe_iso(file_path)
+        if checksum:
+            cache[file_path] = {
+                'size': stat_info.st_size,
+                'mtime_ns': stat_info.st_mtime_ns,
+                'algorithm': _CHECKSUM_ALGORITHM,
+                'checksum': checksum,
+                'structure_valid': structure_valid
+            }
+            self._checksum_cache_dirty = True
+        return checksum, structure_valid
+    
+    def _probe_iso(self, file_path: str) -> Tuple[str, bool]:
+        try:
+            return _probe_iso_file(file_path)
+        except Exception:
+            return "", False
+    
+    def _load_checksum_cache(self) -> Dict:
+        if self._checksum_cache is None:
+            try:
+                with open(self.checksum_cache_path, 'r') as f:
+                    self._checksum_cache = json.load(f)
+            except (OSError, ValueError):
+                self._checksum_cache = {}
+        return self._checksum_cache
+    
+    def _save_checksum_cache(self):
+        if not self._checksum_cache_dirty:
+            return
+        
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            cache_dir = os.path.dirname(self.checksum_cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.iso_checksums_', dir=cache_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self._checksum_cache, f)
+                os.replace(temp_path, self.checksum_cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            self._checksum_cache_dirty = False
+        except OSError:
+            pass
+    
+    def _calculate_checksum(self, file_path: str) -> str:
+        try:
+            fd = _open_readonly(file_path)
+            try:
+                return _checksum_fd(fd)
+            finally:
+                os.close(fd)
         except Exception:
             return ""
     
@@ -79,35 +216,25 @@ class IsoManager:
     
     def _verify_iso_structure(self, iso_path: str) -> bool:
         try:
-            with open(iso_path, 'rb') as f:
-                header = f.read(2048)
-                if len(header) < 2048:
-                    return False
-                
-                if header[0:5] == b'CD001':
-                    return True
-                
-                if header[0:4] == b'\x00\x00\x00\x00':
-                    return True
-                
-                return False
+            fd = _open_readonly(iso_path)
+            try:
+                header = os.read(fd, _ISO_HEADER_SIZE)
+            finally:
+                os.close(fd)
+            
+            return _is_valid_iso_header(header)
         except Exception:
             return False
     
     def mount_iso(self, iso_path: str) -> Dict:
         try:
-            mount_point = os.path.join(self.temp_directory, f"mount_{len(self.mounted_isos)}")
-            os.makedirs(mount_point, exist_ok=True)
+            mount_point = os.path.join(self.temp_directory, f"mount_{next(self._mount_ids)}")
+            try:
+                os.mkdir(mount_point)
+            except FileExistsError:
+                pass
             
-            if os.name == 'nt':
-                result = subprocess.run([
-                    'powershell', '-Command',
-                    f'Mount-DiskImage -ImagePath "{iso_path}" -PassThru | Get-Volume | Get-Partition | Add-PartitionAccessPath -AccessPath "{mount_point}"'
-                ], capture_output=True, text=True)
-            else:
-                result = subprocess.run([
-                    'sudo', 'mount', '-o', 'loop', iso_path, mount_point
-                ], capture_output=True, text=True)
+            result = subprocess.run(self._mount_command(iso_path, mount_point), capture_output=True, text=True)
             
             if result.returncode == 0:
                 self.mounted_isos[iso_path] = mount_point
@@ -125,15 +252,7 @@ class IsoManager:
             
             mount_point = self.mounted_isos[iso_path]
             
-            if os.name == 'nt':
-                result = subprocess.run([
-                    'powershell', '-Command',
-                    f'Dismount-DiskImage -ImagePath "{iso_path}"'
-                ], capture_output=True, text=True)
-            else:
-                result = subprocess.run([
-                    'sudo', 'umount', mount_point
-                ], capture_output=True, text=True)
+            result = subprocess.run(self._unmount_command(iso_path, mount_point), capture_output=True, text=True)
             
             if result.returncode == 0:
                 del self.mounted_isos[iso_path]
@@ -151,15 +270,8 @@ class IsoManager:
             if not install_script:
                 return {'success': False, 'error': 'No installation script found'}
             
-            if os.name == 'nt':
-                result = subprocess.run([
-                    'powershell', '-Command',
-                    f'Start-Process -FilePath "{install_script}" -ArgumentList "/s /t:{target_partition}" -Wait'
-                ], capture_output=True, text=True)
-            else:
-                result = subprocess.run([
-                    'sudo', 'bash', install_script, target_partition
-                ], capture_output=True, text=True)
+            result = subprocess.run(self._install_command(install_script, target_partition), 
+                                    capture_output=True, text=True)
             
             if result.returncode == 0:
                 return {'success': True}
@@ -169,6 +281,33 @@ class IsoManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _windows_mount_command(self, iso_path: str, mount_point: str) -> List[str]:
+        return [
+            'powershell', '-Command',
+            f'Mount-DiskImage -ImagePath "{iso_path}" -PassThru | Get-Volume | Get-Partition | Add-PartitionAccessPath -AccessPath "{mount_point}"'
+        ]
+    
+    def _unix_mount_command(self, iso_path: str, mount_point: str) -> List[str]:
+        return ['sudo', 'mount', '-o', 'loop', iso_path, mount_point]
+    
+    def _windows_unmount_command(self, iso_path: str, mount_point: str) -> List[str]:
+        return [
+            'powershell', '-Command',
+            f'Dismount-DiskImage -ImagePath "{iso_path}"'
+        ]
+    
+    def _unix_unmount_command(self, iso_path: str, mount_point: str) -> List[str]:
+        return ['sudo', 'umount', mount_point]
+    
+    def _windows_install_command(self, install_script: str, target_partition: str) -> List[str]:
+        return [
+            'powershell', '-Command',
+            f'Start-Process -FilePath "{install_script}" -ArgumentList "/s /t:{target_partition}" -Wait'
+        ]
+    
+    def _unix_install_command(self, install_script: str, target_partition: str) -> List[str]:
+        return ['sudo', 'bash', install_script, target_partition]
+    
     def _find_install_script(self, mount_point: str) -> Optional[str]:
         possible_scripts = [
             'setup.exe',
@@ -2,8 +2,10 @@ import os
 import subprocess
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from .iso_manager import IsoManager
 from .bootloader_manager import BootloaderManager
 from .partition_manager import PartitionManager
@@ -21,6 +23,8 @@ class NexusEngine:
         self.system_monitor = SystemMonitor()
         self.current_operation = None
         self.operation_progress = 0
+        self._progress_lock = threading.Lock()
+        self._progress_callback = None
         
     def scan_available_isos(self, directory: str) -> List[Dict]:
         return self.iso_manager.scan_directory(directory)
@@ -28,8 +32,8 @@ class NexusEngine:
     def validate_iso(self, iso_path: str) -> Dict:
         return self.iso_manager.validate_iso_file(iso_path)
     
-    def detect_current_os(self) -> Dict:
-        return self.os_detector.analyze_system()
+    def detect_current_os(self, refresh: bool = False) -> Dict:
+        return self.os_detector.analyze_system(refresh)
     
     def prepare_target_os(self, iso_path: str) -> Dict:
         validation_result = self.validate_iso(iso_path)
@@ -46,42 +50,50 @@ class NexusEngine:
         return self.backup_manager.restore_system_backup(backup_path)
     
     def execute_os_switch(self, iso_path: str, target_partition: str, 
-                         preserve_data: bool = True) -> Dict:
+                         preserve_data: bool = True, 
+                         progress_callback: Optional[Callable[[int, str], None]] = None) -> Dict:
         try:
             self.current_operation = "os_switch"
             self.operation_progress = 0
+            self._progress_callback = progress_callback
+            self._report_progress("Preparing OS switch operation...")
             
-            if preserve_data:
-                backup_result = self.create_backup(tempfile.mkdtemp())
-                if not backup_result['success']:
-                    return {'success': False, 'error': 'Backup failed'}
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                backup_future = None
+                if preserve_data:
+                    backup_future = executor.submit(self._run_step, "System backup created", 
+                                                    self.create_backup, tempfile.mkdtemp())
+                else:
+                    self._advance_progress(20, "Skipping system backup")
+                
+                mount_result = self._run_step("ISO mounted", self.iso_manager.mount_iso, iso_path)
+                backup_result = backup_future.result() if backup_future else {'success': True}
             
-            self.operation_progress = 20
+            if not backup_result['success']:
+                return {'success': False, 'error': 'Backup failed'}
             
-            mount_result = self.iso_manager.mount_iso(iso_path)
             if not mount_result['success']:
                 return {'success': False, 'error': 'ISO mount failed'}
             
-            self.operation_progress = 40
-            
-            partition_result = self.partition_manager.prepare_partition(target_partition)
+            partition_result = self._run_step("Target partition prepared", 
+                                              self.partition_manager.prepare_partition, target_partition)
             if not partition_result['success']:
                 return {'success': False, 'error': 'Partition preparation failed'}
             
-            self.operation_progress = 60
+            self._set_progress(60, "Installing operating system...")
             
             install_result = self.iso_manager.install_from_mounted(mount_result['mount_point'], 
                                                                  target_partition)
             if not install_result['success']:
                 return {'success': False, 'error': 'Installation failed'}
             
-            self.operation_progress = 80
+            self._set_progress(80, "Configuring bootloader...")
             
             bootloader_result = self.bootloader_manager.configure_bootloader(target_partition)
             if not bootloader_result['success']:
                 return {'success': False, 'error': 'Bootloader configuration failed'}
             
-            self.operation_progress = 100
+            self._set_progress(100, "OS switch completed successfully")
             
             return {'success': True, 'message': 'OS switch completed successfully'}
             
@@ -90,10 +102,35 @@ class NexusEngine:
         finally:
             self.current_operation = None
             self.operation_progress = 0
+            self._progress_callback = None
+            self.os_detector.invalidate_cache()
+    
+    def _run_step(self, message: str, step, *args) -> Dict:
+        result = step(*args)
+        if result.get('success'):
+            self._advance_progress(20, message)
+        return result
+    
+    def _advance_progress(self, amount: int, message: str):
+        with self._progress_lock:
+            self.operation_progress += amount
+            self._report_progress(message)
+    
+    def _set_progress(self, progress: int, message: str):
+        with self._progress_lock:
+            self.operation_progress = progress
+            self._report_progress(message)
+    
+    def _report_progress(self, message: str):
+        if self._progress_callback is not None:
+            self._progress_callback(self.operation_progress, message)
     
     def get_system_info(self) -> Dict:
         return self.system_monitor.get_comprehensive_info()
     
+    def get_platform_info(self) -> Dict:
+        return self.system_monitor.get_platform_info()
+    
     def get_operation_status(self) -> Dict:
         return {
             'current_operation': self.current_operation,
@@ -1,10 +1,69 @@
 import os
+import sys
+import atexit
+import threading
 import subprocess
 import platform
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from .powershell_session import PowerShellSession
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+win32com_client = None
+pythoncom = None
+if os.name == 'nt':
+    try:
+        import pythoncom
+        import win32com.client as win32com_client
+    except ImportError:
+        win32com_client = None
+        pythoncom = None
+
+_WINDOWS_VERSION_KEY = r'SOFTWARE\Microsoft\Windows NT\CurrentVersion'
+_SCAN_WORKERS = 8
+_MOUNT_IDLE_SECONDS = 30.0
+_ANALYSIS_SECTIONS = (
+    ('system', 'system_info'),
+    ('boot', 'boot_info'),
+    ('partitions', 'partition_info'),
+    ('detected_os', 'current_os')
+)
+
+def _load_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass
+class OsIndex:
+    files_by_name: Dict[str, List[str]] = field(default_factory=dict)
+    toplevel_dirs_lower: Set[str] = field(default_factory=set)
+    os_release: Optional[str] = None
+    system_version_path: Optional[str] = None
 
 class OsDetector:
     def __init__(self):
@@ -25,31 +84,82 @@ class OsDetector:
                 'directories': ['System', 'Applications']
             }
         }
+        
+        for signatures in self.os_signatures.values():
+            signatures['files_lower'] = frozenset(f.lower() for f in signatures['files'])
+            signatures['directories_lower'] = frozenset(d.lower() for d in signatures['directories'])
+        
+        self._pattern_automaton = self._build_pattern_automaton()
+        self._combined_patterns = (re2 or re).compile('|'.join(
+            f"(?P<{os_type}>{'|'.join(p.lower() for p in signatures['patterns'])})"
+            for os_type, signatures in self.os_signatures.items()
+        ))
+        self._mount_cache = {}
+        self._mount_keys = {}
+        self._mount_lock = threading.Lock()
+        self._powershell = PowerShellSession()
+        atexit.register(self.release_mounts)
+    
+    def _build_pattern_automaton(self):
+        if ahocorasick is None:
+            return None
+        
+        owners = {}
+        for os_type, signatures in self.os_signatures.items():
+            for pattern in signatures['patterns']:
+                owners.setdefault(pattern.lower(), set()).add(os_type)
+        
+        automaton = ahocorasick.Automaton()
+        for word, os_types in owners.items():
+            automaton.add_word(word, frozenset(os_types))
+        automaton.make_automaton()
+        return automaton
     
-    def analyze_system(self) -> Dict:
+    def analyze_system(self, refresh: bool = False) -> Dict:
         try:
-            system_info = {
-                'platform': platform.system(),
-                'platform_version': platform.version(),
-                'architecture': platform.architecture()[0],
-                'processor': platform.processor(),
-                'hostname': platform.node(),
-                'python_version': platform.python_version()
-            }
+            if refresh:
+                self.invalidate_cache()
             
-            boot_info = self._get_boot_information()
-            partition_info = self._get_partition_information()
+            missing = [attribute for _, attribute in _ANALYSIS_SECTIONS if attribute not in self.__dict__]
+            if len(missing) > 1:
+                with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                    list(executor.map(lambda attribute: getattr(self, attribute), missing))
             
-            return {
-                'system': system_info,
-                'boot': boot_info,
-                'partitions': partition_info,
-                'detected_os': self._detect_current_os()
-            }
+            return {key: getattr(self, attribute) for key, attribute in _ANALYSIS_SECTIONS}
             
         except Exception as e:
             return {'error': str(e)}
     
+    def invalidate_cache(self):
+        for _, attribute in _ANALYSIS_SECTIONS:
+            self.__dict__.pop(attribute, None)
+    
+    @cached_property
+    def system_info(self) -> Dict:
+        return self._get_platform_information()
+    
+    @cached_property
+    def boot_info(self) -> Dict:
+        return self._get_boot_information()
+    
+    @cached_property
+    def partition_info(self) -> List[Dict]:
+        return self._get_partition_information()
+    
+    @cached_property
+    def current_os(self) -> Dict:
+        return self._detect_current_os()
+    
+    def _get_platform_information(self) -> Dict:
+        return {
+            'platform': platform.system(),
+            'platform_version': platform.version(),
+            'architecture': platform.architecture()[0],
+            'processor': os.uname().machine if hasattr(os, 'uname') else platform.processor(),
+            'hostname': platform.node(),
+            'python_version': platform.python_version()
+        }
+    
     def _detect_current_os(self) -> Dict:
         try:
             if os.name == 'nt':
@@ -63,45 +173,69 @@ class OsDetector:
     
     def _detect_windows(self) -> Dict:
         try:
-            result = subprocess.run([
-                'powershell', '-Command',
-                'Get-WmiObject -Class Win32_OperatingSystem | Select-Object Caption, Version'
-            ], capture_output=True, text=True)
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _WINDOWS_VERSION_KEY) as key:
+                name = self._query_registry_value(key, 'ProductName') or 'Windows'
+                build = self._query_registry_value(key, 'CurrentBuild')
+                display_version = self._query_registry_value(key, 'DisplayVersion')
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if 'Caption' in line:
-                        name = line.split(':')[1].strip()
-                    elif 'Version' in line:
-                        version = line.split(':')[1].strip()
-                
-                return {'name': name, 'version': version}
-            else:
-                return {'name': 'Windows', 'version': 'Unknown'}
-                
+            windows_version = sys.getwindowsversion()
+            os_info = {
+                'name': name,
+                'version': f'{windows_version.major}.{windows_version.minor}.{build or windows_version.build}'
+            }
+            if display_version:
+                os_info['display_version'] = display_version
+            
+            return os_info
+            
+        except OSError as e:
+            if win32com_client is None:
+                return {'name': 'Windows', 'version': 'Unknown', 'error': str(e)}
+            return self._detect_windows_wmi()
+        except Exception as e:
+            return {'name': 'Windows', 'version': 'Unknown', 'error': str(e)}
+    
+    def _detect_windows_wmi(self) -> Dict:
+        try:
+            for item in self._wmi_query('SELECT Caption, Version FROM Win32_OperatingSystem'):
+                return {'name': item.Caption, 'version': item.Version}
+            return {'name': 'Windows', 'version': 'Unknown'}
         except Exception as e:
             return {'name': 'Windows', 'version': 'Unknown', 'error': str(e)}
     
+    def _wmi_query(self, query: str) -> List:
+        pythoncom.CoInitialize()
+        return list(win32com_client.GetObject('winmgmts:').ExecQuery(query))
+    
+    def _query_registry_value(self, key, value_name: str) -> Optional[str]:
+        try:
+            return str(winreg.QueryValueEx(key, value_name)[0])
+        except OSError:
+            return None
+    
     def _detect_unix_like(self) -> Dict:
         try:
             if os.path.exists('/etc/os-release'):
                 with open('/etc/os-release', 'r') as f:
                     content = f.read()
                 
-                name_match = re.search(r'NAME="([^"]+)"', content)
-                version_match = re.search(r'VERSION="([^"]+)"', content)
+                values = self._parse_shell_assignments(content)
                 
-                name = name_match.group(1) if name_match else 'Linux'
-                version = version_match.group(1) if version_match else 'Unknown'
-                
-                return {'name': name, 'version': version}
+                return {'name': values.get('NAME') or 'Linux', 'version': values.get('VERSION') or 'Unknown'}
             else:
                 return {'name': 'Unix-like', 'version': 'Unknown'}
                 
         except Exception as e:
             return {'name': 'Unix-like', 'version': 'Unknown', 'error': str(e)}
     
+    def _parse_shell_assignments(self, content: str) -> Dict[str, str]:
+        values = {}
+        for line in content.splitlines():
+            key, separator, value = line.partition('=')
+            if separator:
+                values[key.strip()] = value.strip().strip('"\'')
+        return values
+    
     def _get_boot_information(self) -> Dict:
         try:
             if os.name == 'nt':
@@ -114,8 +248,7 @@ class OsDetector:
     def _get_windows_boot_info(self) -> Dict:
         try:
             result = subprocess.run([
-                'powershell', '-Command',
-                'bcdedit /enum firmware'
+                'bcdedit', '/enum', 'firmware'
             ], capture_output=True, text=True)
             
             boot_info = {
@@ -146,9 +279,9 @@ class OsDetector:
                 with open('/etc/default/grub', 'r') as f:
                     content = f.read()
                 
-                default_match = re.search(r'GRUB_DEFAULT="([^"]+)"', content)
-                if default_match:
-                    boot_info['default_entry'] = default_match.group(1)
+                default_entry = self._parse_shell_assignments(content).get('GRUB_DEFAULT')
+                if default_entry:
+                    boot_info['default_entry'] = default_entry
             
             return boot_info
             
@@ -166,24 +299,23 @@ class OsDetector:
     
     def _get_windows_partitions(self) -> List[Dict]:
         try:
-            result = subprocess.run([
-                'powershell', '-Command',
-                'Get-Partition | Select-Object PartitionNumber, DriveLetter, Size, Type'
-            ], capture_output=True, text=True)
+            result = self._powershell.run(
+                'Get-Partition | Select-Object PartitionNumber, DriveLetter, Size, Type | ConvertTo-Json -Compress'
+            )
             
             partitions = []
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines[2:]:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            partitions.append({
-                                'number': parts[0],
-                                'letter': parts[1],
-                                'size': parts[2],
-                                'type': parts[3]
-                            })
+            if result.returncode == 0 and result.stdout.strip():
+                data = _load_json(result.stdout)
+                if isinstance(data, dict):
+                    data = [data]
+                
+                for item in data:
+                    partitions.append({
+                        'number': str(item.get('PartitionNumber', '')),
+                        'letter': str(item.get('DriveLetter') or '').strip('\x00'),
+                        'size': item.get('Size', 0),
+                        'type': item.get('Type', '')
+                    })
             
             return partitions
             
@@ -193,11 +325,11 @@ class OsDetector:
     def _get_unix_partitions(self) -> List[Dict]:
         try:
             result = subprocess.run([
-                'lsblk', '-f', '-J'
-            ], capture_output=True, text=True)
+                'lsblk', '-l', '-J', '-o', 'NAME,TYPE,FSTYPE,SIZE,MOUNTPOINT'
+            ], capture_output=True)
             
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = _load_json(result.stdout)
                 partitions = []
                 
                 for device in data.get('blockdevices', []):
@@ -232,38 +364,102 @@ class OsDetector:
     
     def _mount_iso_temporarily(self, iso_path: str) -> Optional[str]:
         try:
+            key = (iso_path, os.stat(iso_path).st_mtime_ns)
+            with self._mount_lock:
+                cached = self._acquire_cached_mount(key)
+                if cached:
+                    return cached
+                
+                stale = [self._forget_mount(k) for k, entry in list(self._mount_cache.items()) 
+                         if k[0] == iso_path and entry[1] == 0]
+            
+            for stale_key, stale_mount_point in stale:
+                self._release_mount(stale_key, stale_mount_point)
+            
             import tempfile
             mount_point = tempfile.mkdtemp(prefix="detorrent_os_detect_")
             
             if os.name == 'nt':
-                result = subprocess.run([
-                    'powershell', '-Command',
+                result = self._powershell.run(
                     f'Mount-DiskImage -ImagePath "{iso_path}" -PassThru | Get-Volume | Get-Partition | Add-PartitionAccessPath -AccessPath "{mount_point}"'
-                ], capture_output=True, text=True)
+                )
             else:
                 result = subprocess.run([
                     'sudo', 'mount', '-o', 'loop', iso_path, mount_point
-                ], capture_output=True, text=True)
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
-            if result.returncode == 0:
-                return mount_point
-            else:
+            if result.returncode != 0:
+                os.rmdir(mount_point)
                 return None
+            
+            with self._mount_lock:
+                cached = self._acquire_cached_mount(key)
+                if not cached:
+                    self._mount_cache[key] = [mount_point, 1, None]
+                    self._mount_keys[mount_point] = key
+                    return mount_point
+            
+            self._release_mount(key, mount_point)
+            return cached
                 
         except Exception:
             return None
     
+    def _acquire_cached_mount(self, key: Tuple[str, int]) -> Optional[str]:
+        entry = self._mount_cache.get(key)
+        if entry is None:
+            return None
+        
+        entry[1] += 1
+        if entry[2] is not None:
+            entry[2].cancel()
+            entry[2] = None
+        return entry[0]
+    
     def _unmount_iso_temporarily(self, mount_point: str):
+        with self._mount_lock:
+            key = self._mount_keys.get(mount_point)
+            if key is None:
+                return
+            
+            entry = self._mount_cache[key]
+            entry[1] -= 1
+            if entry[1] == 0:
+                entry[2] = threading.Timer(_MOUNT_IDLE_SECONDS, self._release_idle_mount, (key,))
+                entry[2].daemon = True
+                entry[2].start()
+    
+    def _release_idle_mount(self, key: Tuple[str, int]):
+        with self._mount_lock:
+            entry = self._mount_cache.get(key)
+            if entry is None or entry[1] != 0:
+                return
+            released = self._forget_mount(key)
+        
+        self._release_mount(*released)
+    
+    def release_mounts(self):
+        with self._mount_lock:
+            released = [self._forget_mount(key) for key in list(self._mount_cache)]
+        
+        for key, mount_point in released:
+            self._release_mount(key, mount_point)
+    
+    def _forget_mount(self, key: Tuple[str, int]) -> Tuple[Tuple[str, int], str]:
+        mount_point, _, timer = self._mount_cache.pop(key)
+        del self._mount_keys[mount_point]
+        if timer is not None:
+            timer.cancel()
+        return key, mount_point
+    
+    def _release_mount(self, key: Tuple[str, int], mount_point: str):
         try:
             if os.name == 'nt':
-                subprocess.run([
-                    'powershell', '-Command',
-                    f'Dismount-DiskImage -ImagePath "{mount_point}"'
-                ], capture_output=True, text=True)
+                self._powershell.run(f'Dismount-DiskImage -ImagePath "{key[0]}"')
             else:
                 subprocess.run([
                     'sudo', 'umount', mount_point
-                ], capture_output=True, text=True)
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             import shutil
             shutil.rmtree(mount_point, ignore_errors=True)
@@ -280,110 +476,151 @@ class OsDetector:
                 'type': 'Unknown'
             }
             
-            for os_type, signatures in self.os_signatures.items():
-                if self._matches_signatures(mount_point, signatures):
-                    os_info['type'] = os_type
-                    os_info.update(self._extract_version_info(mount_point, os_type))
-                    break
+            index = self._index_mount(mount_point)
+            os_type = self._match_os_type(index)
+            if os_type:
+                os_info['type'] = os_type
+                os_info.update(self._extract_version_info(os_type, index))
             
             return os_info
             
         except Exception as e:
             return {'error': str(e)}
     
-    def _matches_signatures(self, mount_point: str, signatures: Dict) -> bool:
+    def _index_mount(self, mount_point: str, max_depth: int = 3) -> OsIndex:
+        index = OsIndex()
+        pending = [mount_point]
+        
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            for depth in range(max_depth):
+                if not pending:
+                    break
+                
+                next_pending = []
+                for subdirectories, files in executor.map(self._scan_directory, pending):
+                    for name_lower, path in subdirectories:
+                        if depth == 0:
+                            index.toplevel_dirs_lower.add(name_lower)
+                        next_pending.append(path)
+                    
+                    for name_lower, path in files:
+                        index.files_by_name.setdefault(name_lower, []).append(path)
+                
+                pending = next_pending
+        
         try:
-            for pattern in signatures['patterns']:
-                if self._search_in_directory(mount_point, pattern, regex=True):
-                    return True
-            
-            for file_name in signatures['files']:
-                if self._search_in_directory(mount_point, file_name, regex=False):
-                    return True
-            
-            for dir_name in signatures['directories']:
-                if os.path.exists(os.path.join(mount_point, dir_name)):
-                    return True
-            
-            return False
-            
-        except Exception:
-            return False
+            with open(os.path.join(mount_point, 'etc', 'os-release'), 'r') as f:
+                index.os_release = f.read()
+        except OSError:
+            pass
+        
+        system_version_path = os.path.join(mount_point, 'System', 'Library', 'CoreServices', 'SystemVersion.plist')
+        if os.path.exists(system_version_path):
+            index.system_version_path = system_version_path
+        
+        return index
     
-    def _search_in_directory(self, directory: str, pattern: str, regex: bool = False) -> bool:
+    def _scan_directory(self, directory: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        subdirectories = []
+        files = []
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if regex:
-                        if re.search(pattern, file, re.IGNORECASE):
-                            return True
-                    else:
-                        if pattern.lower() in file.lower():
-                            return True
-            return False
-        except Exception:
-            return False
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append((entry.name.lower(), entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append((entry.name.lower(), entry.path))
+        except OSError:
+            pass
+        return subdirectories, files
     
-    def _extract_version_info(self, mount_point: str, os_type: str) -> Dict:
+    def _match_os_type(self, index: OsIndex) -> Optional[str]:
+        files_lower = index.files_by_name.keys()
+        dirs_lower = index.toplevel_dirs_lower
+        pattern_hits = None
+        
+        for os_type, signatures in self.os_signatures.items():
+            if not dirs_lower.isdisjoint(signatures['directories_lower']):
+                return os_type
+            
+            if not files_lower.isdisjoint(signatures['files_lower']):
+                return os_type
+            
+            if pattern_hits is None:
+                pattern_hits = self._pattern_hits(files_lower)
+            if os_type in pattern_hits:
+                return os_type
+        
+        return None
+    
+    def _pattern_hits(self, files_lower: Iterable[str]) -> Set[str]:
+        hits = set()
+        
+        if self._pattern_automaton is not None:
+            for file_lower in files_lower:
+                for _, owners in self._pattern_automaton.iter(file_lower):
+                    hits.update(owners)
+        else:
+            for file_lower in files_lower:
+                for match in self._combined_patterns.finditer(file_lower):
+                    hits.add(match.lastgroup)
+                if len(hits) == len(self.os_signatures):
+                    break
+        
+        return hits
+    
+    def _extract_version_info(self, os_type: str, index: OsIndex) -> Dict:
         try:
             version_info = {}
             
             if os_type == 'windows':
-                version_info.update(self._extract_windows_version(mount_point))
+                version_info.update(self._extract_windows_version(index))
             elif os_type == 'linux':
-                version_info.update(self._extract_linux_version(mount_point))
+                version_info.update(self._extract_linux_version(index))
             elif os_type == 'macos':
-                version_info.update(self._extract_macos_version(mount_point))
+                version_info.update(self._extract_macos_version(index))
             
             return version_info
             
         except Exception as e:
             return {'error': str(e)}
     
-    def _extract_windows_version(self, mount_point: str) -> Dict:
+    def _extract_windows_version(self, index: OsIndex) -> Dict:
         try:
             version_info = {'name': 'Windows', 'version': 'Unknown'}
             
-            for root, dirs, files in os.walk(mount_point):
-                for file in files:
-                    if file.lower() == 'setup.exe':
-                        version_info['installer'] = os.path.join(root, file)
-                        break
+            installers = index.files_by_name.get('setup.exe')
+            if installers:
+                version_info['installer'] = installers[0]
             
             return version_info
             
         except Exception:
             return {'name': 'Windows', 'version': 'Unknown'}
     
-    def _extract_linux_version(self, mount_point: str) -> Dict:
+    def _extract_linux_version(self, index: OsIndex) -> Dict:
         try:
             version_info = {'name': 'Linux', 'version': 'Unknown'}
             
-            os_release_path = os.path.join(mount_point, 'etc', 'os-release')
-            if os.path.exists(os_release_path):
-                with open(os_release_path, 'r') as f:
-                    content = f.read()
-                
-                name_match = re.search(r'NAME="([^"]+)"', content)
-                version_match = re.search(r'VERSION="([^"]+)"', content)
+            if index.os_release is not None:
+                values = self._parse_shell_assignments(index.os_release)
                 
-                if name_match:
-                    version_info['name'] = name_match.group(1)
-                if version_match:
-                    version_info['version'] = version_match.group(1)
+                if values.get('NAME'):
+                    version_info['name'] = values['NAME']
+                if values.get('VERSION'):
+                    version_info['version'] = values['VERSION']
             
             return version_info
             
         except Exception:
             return {'name': 'Linux', 'version': 'Unknown'}
     
-    def _extract_macos_version(self, mount_point: str) -> Dict:
+    def _extract_macos_version(self, index: OsIndex) -> Dict:
         try:
             version_info = {'name': 'macOS', 'version': 'Unknown'}
             
-            system_version_path = os.path.join(mount_point, 'System', 'Library', 'CoreServices', 'SystemVersion.plist')
-            if os.path.exists(system_version_path):
-                version_info['version_file'] = system_version_path
+            if index.system_version_path:
+                version_info['version_file'] = index.system_version_path
             
             return version_info
             
@@ -1,14 +1,60 @@
 import os
+import re
+import asyncio
 import subprocess
+import shlex
 import shutil
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from .powershell_session import PowerShellSession
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_OPERATION_LOG_LIMIT = 1000
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+_CACHE_HOME = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+_OPERATION_LOG_PATH = os.path.join(_CACHE_HOME, 'detorrent', 'partition_operations.log')
+_LSBLK_COMMAND = ('lsblk', '-l', '-b', '-J', '-o', 'NAME,TYPE,FSTYPE,SIZE,MOUNTPOINT,LABEL,UUID')
+_SUDO = ('sudo',)
+_SUDO_SH = ('sudo', 'sh', '-c')
+_MKFS_EXT4 = ('mkfs.ext4', '-F')
+_MKDIR_P = ('mkdir', '-p')
+_MOUNT = ('mount',)
+_PARTED = ('parted',)
+_RESIZE2FS = ('resize2fs',)
+_INSTALL_MOUNT_POINT = '/mnt/detorrent_install'
+_PREPARE_WORKERS = 8
+_PARTITION_SUFFIX = re.compile(r'(?<=\d)p\d+$|(?<=\D)\d+$')
+
+def _run_coroutine(coroutine):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='partition_async') as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+def _load_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class PartitionManager:
     def __init__(self):
         self.partition_cache = {}
-        self.operation_log = []
+        self.operation_log = deque(maxlen=_OPERATION_LOG_LIMIT)
+        self.operation_log_path = _OPERATION_LOG_PATH
+        self._powershell = PowerShellSession()
+        self._disk_locks = defaultdict(threading.Lock)
+        self._disk_locks_guard = threading.Lock()
         
     def list_partitions(self) -> List[Dict]:
         try:
@@ -21,13 +67,12 @@ class PartitionManager:
     
     def _list_windows_partitions(self) -> List[Dict]:
         try:
-            result = subprocess.run([
-                'powershell', '-Command',
+            result = self._ps_exec(
                 'Get-Partition | Select-Object PartitionNumber, DriveLetter, Size, Type, DiskNumber | ConvertTo-Json'
-            ], capture_output=True, text=True)
+            )
             
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = _load_json(result.stdout)
                 partitions = []
                 
                 for partition in data:
@@ -48,26 +93,11 @@ class PartitionManager:
     
     def _list_unix_partitions(self) -> List[Dict]:
         try:
-            result = subprocess.run([
-                'lsblk', '-f', '-J'
-            ], capture_output=True, text=True)
+            result = subprocess.run(_LSBLK_COMMAND, capture_output=True)
             
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                partitions = []
-                
-                for device in data.get('blockdevices', []):
-                    if device.get('type') == 'part':
-                        partitions.append({
-                            'name': device.get('name', ''),
-                            'fstype': device.get('fstype', ''),
-                            'size': device.get('size', ''),
-                            'mountpoint': device.get('mountpoint', ''),
-                            'label': device.get('label', ''),
-                            'uuid': device.get('uuid', '')
-                        })
-                
-                return partitions
+                devices = _load_json(result.stdout).get('blockdevices', [])
+                return [self._lsblk_entry(device) for device in devices if device.get('type') == 'part']
             else:
                 return []
                 
@@ -83,6 +113,37 @@ class PartitionManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def prepare_partitions(self, partition_identifiers: List[str]) -> List[Dict]:
+        if not partition_identifiers:
+            return []
+        
+        disks = self._resolve_disks(partition_identifiers)
+        workers = min(len(partition_identifiers), _PREPARE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prepare_partition') as executor:
+            return list(executor.map(self._prepare_partition_locked, partition_identifiers, disks))
+    
+    def _resolve_disks(self, partition_identifiers: List[str]) -> List[str]:
+        if os.name != 'nt':
+            return [_PARTITION_SUFFIX.sub('', identifier) or identifier for identifier in partition_identifiers]
+        
+        disk_by_letter = {}
+        for partition in self._list_windows_partitions():
+            if partition.get('letter'):
+                disk_by_letter[str(partition['letter']).upper()] = f"disk{partition.get('disk', 0)}"
+        
+        disks = [disk_by_letter.get(str(identifier).rstrip(':').upper()) for identifier in partition_identifiers]
+        if None in disks:
+            return ['*'] * len(partition_identifiers)
+        return disks
+    
+    def _prepare_partition_locked(self, partition_identifier: str, disk: str) -> Dict:
+        with self._disk_lock(disk):
+            return self.prepare_partition(partition_identifier)
+    
+    def _disk_lock(self, disk: str) -> threading.Lock:
+        with self._disk_locks_guard:
+            return self._disk_locks[disk]
+    
     def _prepare_windows_partition(self, partition_identifier: str) -> Dict:
         try:
             commands = [
@@ -91,35 +152,34 @@ class PartitionManager:
             ]
             
             for command in commands:
-                result = subprocess.run([
-                    'powershell', '-Command', command
-                ], capture_output=True, text=True)
+                result = self._ps_exec(command)
                 
                 if result.returncode != 0:
                     return {'success': False, 'error': f'Command failed: {result.stderr}'}
             
-            self.operation_log.append(f'Prepared Windows partition {partition_identifier}')
+            self._record(f'Prepared Windows partition {partition_identifier}')
             return {'success': True, 'message': f'Partition {partition_identifier} prepared'}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def _prepare_unix_partition(self, partition_identifier: str) -> Dict:
+        return _run_coroutine(self._prepare_unix_partition_async(partition_identifier))
+    
+    async def _prepare_unix_partition_async(self, partition_identifier: str) -> Dict:
         try:
-            commands = [
-                f'sudo mkfs.ext4 -F {partition_identifier}',
-                f'sudo mkdir -p /mnt/detorrent_install',
-                f'sudo mount {partition_identifier} /mnt/detorrent_install'
-            ]
-            
-            for command in commands:
-                result = subprocess.run(command.split(), capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    return {'success': False, 'error': f'Command failed: {result.stderr}'}
+            mount_point = f'{_INSTALL_MOUNT_POINT}_{os.path.basename(partition_identifier)}'
+            result = await self._run_privileged_async([
+                _MKFS_EXT4 + (partition_identifier,),
+                _MKDIR_P + (mount_point,),
+                _MOUNT + (partition_identifier, mount_point)
+            ])
+            if result.returncode != 0:
+                return {'success': False, 'error': f'Command failed: {result.stderr}'}
             
-            self.operation_log.append(f'Prepared Unix partition {partition_identifier}')
-            return {'success': True, 'message': f'Partition {partition_identifier} prepared'}
+            self._record(f'Prepared Unix partition {partition_identifier}')
+            return {'success': True, 'message': f'Partition {partition_identifier} prepared', 
+                    'mount_point': mount_point}
             
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -137,12 +197,10 @@ class PartitionManager:
         try:
             command = f'New-Partition -DiskNumber {disk_identifier} -Size {size} -PartitionType {partition_type}'
             
-            result = subprocess.run([
-                'powershell', '-Command', command
-            ], capture_output=True, text=True)
+            result = self._ps_exec(command)
             
             if result.returncode == 0:
-                self.operation_log.append(f'Created Windows partition on disk {disk_identifier}')
+                self._record(f'Created Windows partition on disk {disk_identifier}')
                 return {'success': True, 'message': 'Partition created successfully'}
             else:
                 return {'success': False, 'error': result.stderr}
@@ -151,19 +209,20 @@ class PartitionManager:
             return {'success': False, 'error': str(e)}
     
     def _create_unix_partition(self, disk_identifier: str, size: str, partition_type: str) -> Dict:
+        return _run_coroutine(self._create_unix_partition_async(disk_identifier, size, partition_type))
+    
+    async def _create_unix_partition_async(self, disk_identifier: str, size: str, partition_type: str) -> Dict:
         try:
             commands = [
-                f'sudo parted {disk_identifier} mkpart {partition_type} 0% 100%',
-                f'sudo mkfs.ext4 -F {disk_identifier}1'
+                _PARTED + (disk_identifier, 'mkpart', partition_type, '0%', '100%'),
+                _MKFS_EXT4 + (f'{disk_identifier}1',)
             ]
             
-            for command in commands:
-                result = subprocess.run(command.split(), capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    return {'success': False, 'error': f'Command failed: {result.stderr}'}
+            result = await self._run_privileged_async(commands)
+            if result.returncode != 0:
+                return {'success': False, 'error': f'Command failed: {result.stderr}'}
             
-            self.operation_log.append(f'Created Unix partition on disk {disk_identifier}')
+            self._record(f'Created Unix partition on disk {disk_identifier}')
             return {'success': True, 'message': 'Partition created successfully'}
             
         except Exception as e:
@@ -182,12 +241,10 @@ class PartitionManager:
         try:
             command = f'Remove-Partition -PartitionNumber {partition_identifier} -Confirm:$false'
             
-            result = subprocess.run([
-                'powershell', '-Command', command
-            ], capture_output=True, text=True)
+            result = self._ps_exec(command)
             
             if result.returncode == 0:
-                self.operation_log.append(f'Deleted Windows partition {partition_identifier}')
+                self._record(f'Deleted Windows partition {partition_identifier}')
                 return {'success': True, 'message': 'Partition deleted successfully'}
             else:
                 return {'success': False, 'error': result.stderr}
@@ -197,12 +254,12 @@ class PartitionManager:
     
     def _delete_unix_partition(self, partition_identifier: str) -> Dict:
         try:
-            command = f'sudo parted {partition_identifier} rm 1'
+            command = _SUDO + _PARTED + (partition_identifier, 'rm', '1')
             
-            result = subprocess.run(command.split(), capture_output=True, text=True)
+            result = subprocess.run(command, capture_output=True, text=True)
             
             if result.returncode == 0:
-                self.operation_log.append(f'Deleted Unix partition {partition_identifier}')
+                self._record(f'Deleted Unix partition {partition_identifier}')
                 return {'success': True, 'message': 'Partition deleted successfully'}
             else:
                 return {'success': False, 'error': result.stderr}
@@ -223,12 +280,10 @@ class PartitionManager:
         try:
             command = f'Resize-Partition -PartitionNumber {partition_identifier} -Size {new_size}'
             
-            result = subprocess.run([
-                'powershell', '-Command', command
-            ], capture_output=True, text=True)
+            result = self._ps_exec(command)
             
             if result.returncode == 0:
-                self.operation_log.append(f'Resized Windows partition {partition_identifier}')
+                self._record(f'Resized Windows partition {partition_identifier}')
                 return {'success': True, 'message': 'Partition resized successfully'}
             else:
                 return {'success': False, 'error': result.stderr}
@@ -237,19 +292,20 @@ class PartitionManager:
             return {'success': False, 'error': str(e)}
     
     def _resize_unix_partition(self, partition_identifier: str, new_size: str) -> Dict:
+        return _run_coroutine(self._resize_unix_partition_async(partition_identifier, new_size))
+    
+    async def _resize_unix_partition_async(self, partition_identifier: str, new_size: str) -> Dict:
         try:
             commands = [
-                f'sudo parted {partition_identifier} resizepart 1 {new_size}',
-                f'sudo resize2fs {partition_identifier}1'
+                _PARTED + (partition_identifier, 'resizepart', '1', new_size),
+                _RESIZE2FS + (f'{partition_identifier}1',)
             ]
             
-            for command in commands:
-                result = subprocess.run(command.split(), capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    return {'success': False, 'error': f'Command failed: {result.stderr}'}
+            result = await self._run_privileged_async(commands)
+            if result.returncode != 0:
+                return {'success': False, 'error': f'Command failed: {result.stderr}'}
             
-            self.operation_log.append(f'Resized Unix partition {partition_identifier}')
+            self._record(f'Resized Unix partition {partition_identifier}')
             return {'success': True, 'message': 'Partition resized successfully'}
             
         except Exception as e:
@@ -268,12 +324,10 @@ class PartitionManager:
         try:
             command = f'Format-Volume -DriveLetter {partition_identifier} -FileSystem {filesystem} -Confirm:$false'
             
-            result = subprocess.run([
-                'powershell', '-Command', command
-            ], capture_output=True, text=True)
+            result = self._ps_exec(command)
             
             if result.returncode == 0:
-                self.operation_log.append(f'Formatted Windows partition {partition_identifier}')
+                self._record(f'Formatted Windows partition {partition_identifier}')
                 return {'success': True, 'message': 'Partition formatted successfully'}
             else:
                 return {'success': False, 'error': result.stderr}
@@ -283,12 +337,12 @@ class PartitionManager:
     
     def _format_unix_partition(self, partition_identifier: str, filesystem: str) -> Dict:
         try:
-            command = f'sudo mkfs.{filesystem.lower()} -F {partition_identifier}'
+            command = _SUDO + (f'mkfs.{filesystem.lower()}', '-F', partition_identifier)
             
-            result = subprocess.run(command.split(), capture_output=True, text=True)
+            result = subprocess.run(command, capture_output=True, text=True)
             
             if result.returncode == 0:
-                self.operation_log.append(f'Formatted Unix partition {partition_identifier}')
+                self._record(f'Formatted Unix partition {partition_identifier}')
                 return {'success': True, 'message': 'Partition formatted successfully'}
             else:
                 return {'success': False, 'error': result.stderr}
@@ -309,12 +363,10 @@ class PartitionManager:
         try:
             command = f'Get-Partition -PartitionNumber {partition_identifier} | ConvertTo-Json'
             
-            result = subprocess.run([
-                'powershell', '-Command', command
-            ], capture_output=True, text=True)
+            result = self._ps_exec(command)
             
             if result.returncode == 0:
-                data = json.loads(result.stdout)
+                data = _load_json(result.stdout)
                 return {
                     'number': data.get('PartitionNumber', 0),
                     'letter': data.get('DriveLetter', ''),
@@ -330,30 +382,75 @@ class PartitionManager:
     
     def _get_unix_partition_info(self, partition_identifier: str) -> Dict:
         try:
-            command = f'lsblk -f -J {partition_identifier}'
-            
-            result = subprocess.run(command.split(), capture_output=True, text=True)
+            result = subprocess.run(_LSBLK_COMMAND + (partition_identifier,), capture_output=True)
             
             if result.returncode == 0:
-                data = json.loads(result.stdout)
-                device = data.get('blockdevices', [{}])[0]
-                
-                return {
-                    'name': device.get('name', ''),
-                    'fstype': device.get('fstype', ''),
-                    'size': device.get('size', ''),
-                    'mountpoint': device.get('mountpoint', ''),
-                    'label': device.get('label', ''),
-                    'uuid': device.get('uuid', '')
-                }
+                devices = _load_json(result.stdout).get('blockdevices') or [{}]
+                return self._lsblk_entry(devices[0])
             else:
-                return {'error': result.stderr}
+                return {'error': result.stderr.decode(errors='replace')}
                 
         except Exception as e:
             return {'error': str(e)}
     
+    def _lsblk_entry(self, device: Dict) -> Dict:
+        return {
+            'name': device.get('name', ''),
+            'fstype': device.get('fstype', ''),
+            'size': device.get('size', 0),
+            'mountpoint': device.get('mountpoint', ''),
+            'label': device.get('label', ''),
+            'uuid': device.get('uuid', '')
+        }
+    
+    async def _run_privileged_async(self, *chains: List[Tuple[str, ...]]) -> subprocess.CompletedProcess:
+        results = await asyncio.gather(*(self._run_chain_async(chain) for chain in chains))
+        failed = [result for result in results if result.returncode != 0]
+        return subprocess.CompletedProcess(
+            [result.args for result in results],
+            failed[0].returncode if failed else 0,
+            ''.join(result.stdout for result in results),
+            ''.join(result.stderr for result in failed)
+        )
+    
+    async def _run_chain_async(self, commands: List[Tuple[str, ...]]) -> subprocess.CompletedProcess:
+        args = _SUDO_SH + (' && '.join(shlex.join(command) for command in commands),)
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return subprocess.CompletedProcess(
+            args, process.returncode,
+            stdout.decode(errors='replace'), stderr.decode(errors='replace')
+        )
+    
+    def _ps_exec(self, command: str) -> subprocess.CompletedProcess:
+        return self._powershell.run(command)
+    
+    def close(self):
+        self._powershell.close()
+    
+    def _record(self, *entries: str):
+        self.operation_log.extend(entries)
+        if not self.operation_log_path:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(self.operation_log_path), exist_ok=True)
+            fd = os.open(self.operation_log_path, _LOG_OPEN_FLAGS, 0o600)
+            try:
+                lines = [f'{entry}\n'.encode('utf-8') for entry in entries]
+                if hasattr(os, 'writev'):
+                    os.writev(fd, lines)
+                else:
+                    os.write(fd, b''.join(lines))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    
     def get_operation_log(self) -> List[str]:
-        return self.operation_log.copy()
+        return list(self.operation_log)
     
     def clear_operation_log(self):
         self.operation_log.clear()
@@ -0,0 +1,84 @@
+import base64
+import itertools
+import subprocess
+import threading
+
+_SESSION_SETUP = (
+    "$ErrorActionPreference = 'Stop'; "
+    "$ProgressPreference = 'SilentlyContinue'; "
+    "[Console]::OutputEncoding = [Text.Encoding]::UTF8\n"
+)
+
+_COMMAND_TEMPLATE = (
+    "$global:LASTEXITCODE = 0; "
+    "try {{ & ([ScriptBlock]::Create([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{script}')))) "
+    "| Out-String -Stream -Width 4096; $detorrentCode = $LASTEXITCODE }} "
+    "catch {{ $_ | Out-String -Stream -Width 4096; $detorrentCode = 1 }}; "
+    "Write-Output ('{sentinel}' + $detorrentCode)\n"
+)
+
+class PowerShellSession:
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        self._sentinels = itertools.count()
+    
+    def run(self, command: str) -> subprocess.CompletedProcess:
+        with self._lock:
+            try:
+                process = self._ensure_process()
+                sentinel = f'__DETORRENT_END_{next(self._sentinels)}__:'
+                script = base64.b64encode(command.encode('utf-8')).decode('ascii')
+                process.stdin.write(_COMMAND_TEMPLATE.format(script=script, sentinel=sentinel))
+                process.stdin.flush()
+                
+                output = []
+                for line in process.stdout:
+                    if line.startswith(sentinel):
+                        code = line[len(sentinel):].strip()
+                        returncode = int(code) if code.lstrip('-').isdigit() else 1
+                        stdout = ''.join(output)
+                        return subprocess.CompletedProcess(command, returncode, stdout, stdout if returncode else '')
+                    output.append(line)
+                
+                self._discard_process()
+                return subprocess.CompletedProcess(command, 1, ''.join(output), 'PowerShell session terminated')
+                
+            except OSError as e:
+                self._discard_process()
+                return subprocess.CompletedProcess(command, 1, '', str(e))
+    
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen([
+                'powershell', '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-'
+            ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+               text=True, encoding='utf-8', errors='replace', bufsize=1)
+            self._process.stdin.write(_SESSION_SETUP)
+            self._process.stdin.flush()
+        return self._process
+    
+    def _discard_process(self):
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.kill()
+    
+    def close(self):
+        with self._lock:
+            process, self._process = self._process, None
+        
+        if process is None or process.poll() is not None:
+            return
+        
+        try:
+            process.stdin.write('exit\n')
+            process.stdin.flush()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
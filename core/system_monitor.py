@@ -1,56 +1,95 @@
 import os
+import re
 import subprocess
 import platform
+import heapq
 import psutil
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
+
+_USAGE_FRESHNESS = 2.0
+_PARTITIONS_TTL = 2.0
+_HAS_STATVFS = hasattr(os, 'statvfs')
+_GRUB_SETTING = re.compile(r'^GRUB_(DEFAULT|TIMEOUT)="?([^"\n]*)"?', re.M)
+_GRUB_KEYS = {'DEFAULT': 'default_entry', 'TIMEOUT': 'timeout'}
+_BOOTUP_STATE = re.compile(r'BootupState\s*:\s*([^:\r\n]*)')
+
+def to_iso(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
 
 class SystemMonitor:
     def __init__(self):
         self.monitoring_active = False
         self.system_metrics = {}
+        self._usage_executor = None
+        self._usage_snapshot = None
+        self._partitions_cache = None
+        self._partitions_ttl = _PARTITIONS_TTL
+        self._last_cpu = None
+        self._cpu_sampler = None
+        self._cpu_sampler_stop = threading.Event()
+        self._proc_cache = {}
+        self._proc_cache_lock = threading.Lock()
+        self._last_io = {}
+        psutil.cpu_percent(interval=None)
         
-    def get_comprehensive_info(self) -> Dict:
+    def get_comprehensive_info(self, include_connections: bool = False) -> Dict:
         try:
-            system_info = {
-                'platform': self._get_platform_info(),
-                'hardware': self._get_hardware_info(),
-                'memory': self._get_memory_info(),
-                'storage': self._get_storage_info(),
-                'network': self._get_network_info(),
-                'processes': self._get_process_info(),
-                'boot': self._get_boot_info(),
-                'timestamp': datetime.now().isoformat()
+            collectors = {
+                'platform': self._get_platform_info,
+                'hardware': self._get_hardware_info,
+                'memory': self._get_memory_info,
+                'storage': self._get_storage_info,
+                'network': lambda: self._get_network_info(include_connections),
+                'processes': self._get_process_info,
+                'boot': self._get_boot_info
             }
             
+            with ThreadPoolExecutor(max_workers=len(collectors), thread_name_prefix='collector') as executor:
+                futures = {key: executor.submit(collector) for key, collector in collectors.items()}
+                system_info = {key: future.result() for key, future in futures.items()}
+            
+            system_info['timestamp_ns'] = time.time_ns()
             return system_info
             
         except Exception as e:
             return {'error': str(e)}
     
+    def get_platform_info(self) -> Dict:
+        return self._get_platform_info()
+    
     def _get_platform_info(self) -> Dict:
         try:
-            return {
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'machine': platform.machine(),
-                'processor': platform.processor(),
-                'architecture': platform.architecture()[0],
-                'hostname': platform.node(),
-                'python_version': platform.python_version()
-            }
+            return dict(self._platform_info)
         except Exception as e:
             return {'error': str(e)}
     
+    @cached_property
+    def _platform_info(self) -> Dict:
+        uname = platform.uname()
+        return {
+            'system': uname.system,
+            'release': uname.release,
+            'version': uname.version,
+            'machine': uname.machine,
+            'processor': uname.processor,
+            'architecture': platform.architecture()[0],
+            'hostname': uname.node,
+            'python_version': platform.python_version()
+        }
+    
     def _get_hardware_info(self) -> Dict:
         try:
             cpu_info = {
                 'count': psutil.cpu_count(),
                 'count_logical': psutil.cpu_count(logical=True),
                 'frequency': psutil.cpu_freq(),
-                'usage_percent': psutil.cpu_percent(interval=1)
+                'usage_percent': self._cpu_percent()
             }
             
             return {
@@ -84,30 +123,88 @@ class SystemMonitor:
         try:
             storage_info = []
             
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    storage_info.append({
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total': usage.total,
-                        'used': usage.used,
-                        'free': usage.free,
-                        'percent': (usage.used / usage.total) * 100
-                    })
-                except PermissionError:
-                    continue
+            for partition, usage in self._disk_usage_snapshot().values():
+                storage_info.append({
+                    'device': partition.device,
+                    'mountpoint': partition.mountpoint,
+                    'fstype': partition.fstype,
+                    'total': usage.total,
+                    'used': usage.used,
+                    'free': usage.free,
+                    'percent': (usage.used / usage.total) * 100
+                })
             
             return storage_info
         except Exception as e:
             return [{'error': str(e)}]
     
-    def _get_network_info(self) -> Dict:
+    def _disk_usage_snapshot(self, max_age: float = 0) -> Dict:
+        snapshot = self._usage_snapshot
+        if snapshot is not None and max_age and time.monotonic() - snapshot[0] <= max_age:
+            return snapshot[1]
+        
+        usage_by_mount = self._probe_usage_parallel(self._cached_partitions())
+        self._usage_snapshot = (time.monotonic(), usage_by_mount)
+        return usage_by_mount
+    
+    def _cached_partitions(self) -> List:
+        cached = self._partitions_cache
+        if cached is not None and time.monotonic() - cached[0] < self._partitions_ttl:
+            return cached[1]
+        
+        partitions = psutil.disk_partitions()
+        self._partitions_cache = (time.monotonic(), partitions)
+        return partitions
+    
+    def _probe_usage_parallel(self, partitions: List) -> Dict:
+        usage_by_mount = {}
+        for partition, usage in zip(partitions, self._get_usage_executor().map(self._probe_usage, partitions)):
+            if usage is not None:
+                usage_by_mount[partition.mountpoint] = (partition, usage)
+        return usage_by_mount
+    
+    def _fast_usage_by_mount(self) -> Dict:
+        mountpoints = [partition.mountpoint for partition in self._cached_partitions()]
+        usage_by_mount = {}
+        for mountpoint, usage in zip(mountpoints, self._get_usage_executor().map(self._usage_fast, mountpoints)):
+            if usage is not None:
+                usage_by_mount[mountpoint] = usage
+        return usage_by_mount
+    
+    def _get_usage_executor(self) -> ThreadPoolExecutor:
+        if self._usage_executor is None:
+            self._usage_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, 
+                                                      thread_name_prefix='disk_usage')
+        return self._usage_executor
+    
+    def _probe_usage(self, partition):
+        try:
+            return psutil.disk_usage(partition.mountpoint)
+        except PermissionError:
+            return None
+    
+    def _usage_fast(self, mountpoint: str) -> Optional[Tuple[float, int]]:
+        try:
+            if _HAS_STATVFS:
+                st = os.statvfs(mountpoint)
+                total = st.f_blocks * st.f_frsize
+                used = (st.f_blocks - st.f_bfree) * st.f_frsize
+                free = st.f_bavail * st.f_frsize
+            else:
+                usage = psutil.disk_usage(mountpoint)
+                total, used, free = usage.total, usage.used, usage.free
+        except PermissionError:
+            return None
+        
+        if total == 0:
+            return None
+        return (used / total) * 100, free
+    
+    def _get_network_info(self, include_connections: bool = False) -> Dict:
         try:
             network_info = {
                 'interfaces': [],
-                'connections': []
+                'connections': [] if include_connections else None
             }
             
             for interface, addrs in psutil.net_if_addrs().items():
@@ -126,16 +223,17 @@ class SystemMonitor:
                 
                 network_info['interfaces'].append(interface_info)
             
-            for conn in psutil.net_connections(kind='inet'):
-                network_info['connections'].append({
-                    'fd': conn.fd,
-                    'family': str(conn.family),
-                    'type': str(conn.type),
-                    'laddr': conn.laddr,
-                    'raddr': conn.raddr,
-                    'status': conn.status,
-                    'pid': conn.pid
-                })
+            if include_connections:
+                for conn in psutil.net_connections(kind='inet'):
+                    network_info['connections'].append({
+                        'fd': conn.fd,
+                        'family': str(conn.family),
+                        'type': str(conn.type),
+                        'laddr': conn.laddr,
+                        'raddr': conn.raddr,
+                        'status': conn.status,
+                        'pid': conn.pid
+                    })
             
             return network_info
         except Exception as e:
@@ -145,22 +243,37 @@ class SystemMonitor:
         try:
             processes = []
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            for proc in self._refresh_proc_cache():
                 try:
-                    proc_info = proc.info
-                    processes.append({
-                        'pid': proc_info['pid'],
-                        'name': proc_info['name'],
-                        'cpu_percent': proc_info['cpu_percent'],
-                        'memory_percent': proc_info['memory_percent']
-                    })
+                    with proc.oneshot():
+                        processes.append({
+                            'pid': proc.pid,
+                            'name': proc.name(),
+                            'cpu_percent': proc.cpu_percent(),
+                            'memory_percent': proc.memory_percent()
+                        })
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            return sorted(processes, key=lambda x: x['cpu_percent'], reverse=True)[:20]
+            return heapq.nlargest(20, processes, key=lambda x: x['cpu_percent'] or 0)
         except Exception as e:
             return [{'error': str(e)}]
     
+    def _refresh_proc_cache(self) -> List:
+        pids = set(psutil.pids())
+        with self._proc_cache_lock:
+            cache = self._proc_cache
+            for pid in cache.keys() - pids:
+                del cache[pid]
+            
+            for pid in pids - cache.keys():
+                try:
+                    cache[pid] = psutil.Process(pid)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            
+            return list(cache.values())
+    
     def _get_boot_info(self) -> Dict:
         try:
             if os.name == 'nt':
@@ -184,10 +297,9 @@ class SystemMonitor:
             }
             
             if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'BootupState' in line:
-                        boot_info['boot_state'] = line.split(':')[1].strip()
+                match = _BOOTUP_STATE.search(result.stdout)
+                if match:
+                    boot_info['boot_state'] = match.group(1).strip()
             
             return boot_info
         except Exception as e:
@@ -204,12 +316,8 @@ class SystemMonitor:
                 with open('/etc/default/grub', 'r') as f:
                     content = f.read()
                 
-                lines = content.split('\n')
-                for line in lines:
-                    if line.startswith('GRUB_DEFAULT'):
-                        boot_info['default_entry'] = line.split('=')[1].strip('"')
-                    elif line.startswith('GRUB_TIMEOUT'):
-                        boot_info['timeout'] = line.split('=')[1].strip('"')
+                for match in _GRUB_SETTING.finditer(content):
+                    boot_info[_GRUB_KEYS[match.group(1)]] = match.group(2)
             
             return boot_info
         except Exception as e:
@@ -219,6 +327,9 @@ class SystemMonitor:
         try:
             self.monitoring_active = True
             self.system_metrics = {}
+            self._start_cpu_sampler(interval)
+            with self._proc_cache_lock:
+                self._proc_cache = {}
             
             return {'success': True, 'message': f'Monitoring started with {interval}s interval'}
         except Exception as e:
@@ -227,37 +338,76 @@ class SystemMonitor:
     def stop_monitoring(self) -> Dict:
         try:
             self.monitoring_active = False
+            self._stop_cpu_sampler()
             return {'success': True, 'message': 'Monitoring stopped'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def _start_cpu_sampler(self, interval: float):
+        self._stop_cpu_sampler()
+        self._last_cpu = psutil.cpu_percent(interval=None)
+        stop_event = self._cpu_sampler_stop = threading.Event()
+        self._cpu_sampler = threading.Thread(target=self._sample_cpu, args=(interval, stop_event), 
+                                             name='cpu_sampler', daemon=True)
+        self._cpu_sampler.start()
+    
+    def _stop_cpu_sampler(self):
+        self._cpu_sampler_stop.set()
+        self._cpu_sampler = None
+        self._last_cpu = None
+    
+    def _sample_cpu(self, interval: float, stop_event: threading.Event):
+        while not stop_event.wait(interval):
+            self._last_cpu = psutil.cpu_percent(interval=None)
+    
+    def _cpu_percent(self) -> float:
+        last_cpu = self._last_cpu
+        if last_cpu is not None:
+            return last_cpu
+        return psutil.cpu_percent(interval=None)
+    
     def get_current_metrics(self) -> Dict:
         try:
             if not self.monitoring_active:
                 return {'error': 'Monitoring not active'}
             
             current_metrics = {
-                'cpu_percent': psutil.cpu_percent(interval=1),
+                'cpu_percent': self._cpu_percent(),
                 'memory_percent': psutil.virtual_memory().percent,
                 'disk_usage': {},
-                'network_io': psutil.net_io_counters()._asdict(),
-                'timestamp': datetime.now().isoformat()
+                'network_io': self._io_rates('network', psutil.net_io_counters(nowrap=True), 
+                                             ('bytes_sent', 'bytes_recv')),
+                'disk_io': self._io_rates('disk', psutil.disk_io_counters(perdisk=False, nowrap=True), 
+                                          ('read_bytes', 'write_bytes')),
+                'timestamp_ns': time.time_ns()
             }
             
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    current_metrics['disk_usage'][partition.mountpoint] = {
-                        'percent': (usage.used / usage.total) * 100,
-                        'free_gb': usage.free / (1024**3)
-                    }
-                except PermissionError:
-                    continue
+            for mountpoint, (percent, free) in self._fast_usage_by_mount().items():
+                current_metrics['disk_usage'][mountpoint] = {
+                    'percent': percent,
+                    'free_gb': free / (1024**3)
+                }
             
             return current_metrics
         except Exception as e:
             return {'error': str(e)}
     
+    def _io_rates(self, name: str, counters, fields: Tuple[str, ...]) -> Dict:
+        now = time.monotonic()
+        totals = counters._asdict() if counters is not None else {}
+        previous = self._last_io.get(name)
+        self._last_io[name] = (now, totals)
+        
+        rates = {}
+        for field_name in fields:
+            rate = None
+            if previous is not None and now > previous[0] and field_name in totals:
+                rate = (totals[field_name] - previous[1].get(field_name, 0)) / (now - previous[0])
+            rates[f'{field_name}_per_s'] = rate
+        
+        rates['totals'] = totals
+        return rates
+    
     def get_system_health(self) -> Dict:
         try:
             health_status = {
@@ -266,7 +416,7 @@ class SystemMonitor:
                 'recommendations': []
             }
             
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._cpu_percent()
             memory_percent = psutil.virtual_memory().percent
             
             if cpu_percent > 80:
@@ -277,16 +427,12 @@ class SystemMonitor:
                 health_status['issues'].append('High memory usage')
                 health_status['recommendations'].append('Free up memory or add more RAM')
             
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_percent = (usage.used / usage.total) * 100
-                    
-                    if disk_percent > 90:
-                        health_status['issues'].append(f'Low disk space on {partition.mountpoint}')
-                        health_status['recommendations'].append(f'Free up space on {partition.mountpoint}')
-                except PermissionError:
-                    continue
+            for mountpoint, (partition, usage) in self._disk_usage_snapshot(_USAGE_FRESHNESS).items():
+                disk_percent = (usage.used / usage.total) * 100
+                
+                if disk_percent > 90:
+                    health_status['issues'].append(f'Low disk space on {mountpoint}')
+                    health_status['recommendations'].append(f'Free up space on {mountpoint}')
             
             if health_status['issues']:
                 health_status['overall'] = 'warning'
@@ -299,16 +445,19 @@ class SystemMonitor:
         try:
             processes = []
             
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
+            process_name = process_name.lower()
+            for proc in self._refresh_proc_cache():
                 try:
-                    if process_name.lower() in proc.info['name'].lower():
-                        processes.append({
-                            'pid': proc.info['pid'],
-                            'name': proc.info['name'],
-                            'cpu_percent': proc.info['cpu_percent'],
-                            'memory_percent': proc.info['memory_percent'],
-                            'status': proc.info['status']
-                        })
+                    with proc.oneshot():
+                        name = proc.name()
+                        if process_name in name.lower():
+                            processes.append({
+                                'pid': proc.pid,
+                                'name': name,
+                                'cpu_percent': proc.cpu_percent(),
+                                'memory_percent': proc.memory_percent(),
+                                'status': proc.status()
+                            })
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
@@ -1,23 +1,113 @@
 import sys
 import os
+import asyncio
+import contextlib
+from collections import deque
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+from typing import Dict
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QGridLayout, QLabel, QPushButton, QLineEdit, 
                              QTextEdit, QProgressBar, QComboBox, QListWidget, 
-                             QListWidgetItem, QTabWidget, QGroupBox, QCheckBox,
+                             QTabWidget, QGroupBox, QCheckBox,
                              QSpinBox, QSlider, QFileDialog, QMessageBox,
                              QSplitter, QTreeWidget, QTreeWidgetItem)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer, QRunnable, QThreadPool, QSettings
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QTextCursor
+from qasync import asyncSlot
 from core.nexus_engine import NexusEngine
 
+_IS_NT = os.name == 'nt'
+_PARTITION_TEMPLATE = ("Partition {number} ({letter}) - {size}" if _IS_NT 
+                       else "{name} - {size} ({fstype})")
+_SIZE_UNITS = ('B', 'K', 'M', 'G', 'T', 'P')
+_MONITOR_INTERVAL_MS = 1000
+_HEALTH_CHECK_TICKS = 5
+_VALIDATION_DEBOUNCE_MS = 200
+_LOG_FLUSH_MS = 100
+_UI_FLUSH_MS = 33
+_INTERFACE_QSS = "QPushButton#execute { background-color: #e74c3c; color: white; font-weight: bold; padding: 10px; }"
+_ISO_FILE_FILTER = "ISO Files (*.iso *.img *.dmg *.vdi *.vmdk)"
+_DARK_ROLES = {
+    QPalette.ColorRole.Window: (53, 53, 53),
+    QPalette.ColorRole.WindowText: (255, 255, 255),
+    QPalette.ColorRole.Base: (25, 25, 25),
+    QPalette.ColorRole.AlternateBase: (53, 53, 53),
+    QPalette.ColorRole.ToolTipBase: (0, 0, 0),
+    QPalette.ColorRole.ToolTipText: (255, 255, 255),
+    QPalette.ColorRole.Text: (255, 255, 255),
+    QPalette.ColorRole.Button: (53, 53, 53),
+    QPalette.ColorRole.ButtonText: (255, 255, 255),
+    QPalette.ColorRole.BrightText: (255, 0, 0),
+    QPalette.ColorRole.Link: (42, 130, 218),
+    QPalette.ColorRole.Highlight: (42, 130, 218),
+    QPalette.ColorRole.HighlightedText: (0, 0, 0)
+}
+
+def _format_size(size) -> str:
+    if not isinstance(size, (int, float)):
+        return str(size)
+    
+    size = float(size)
+    for unit in _SIZE_UNITS:
+        if size < 1024 or unit == _SIZE_UNITS[-1]:
+            break
+        size /= 1024
+    return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+
+def _partition_label(partition: Dict) -> str:
+    return _PARTITION_TEMPLATE.format_map(dict(partition, size=_format_size(partition.get('size', 0))))
+
+@lru_cache(maxsize=None)
+def _dark_palette() -> QPalette:
+    palette = QPalette()
+    for role, rgb in _DARK_ROLES.items():
+        palette.setColor(role, QColor(*rgb))
+    return palette
+
+@lru_cache(maxsize=None)
+def _light_palette() -> QPalette:
+    return QApplication.style().standardPalette()
+
+class _EngineTask(QRunnable):
+    def __init__(self, func, args, future: Future):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.future = future
+        
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        
+        try:
+            self.future.set_result(self.func(*self.args))
+        except BaseException as e:
+            self.future.set_exception(e)
+
+def _to_thread(func, *args):
+    future = Future()
+    QThreadPool.globalInstance().start(_EngineTask(func, args, future))
+    return asyncio.wrap_future(future)
+
 class QuantumInterface(QMainWindow):
     def __init__(self, engine: NexusEngine):
         super().__init__()
         self.engine = engine
         self.current_iso_path = None
         self.current_partition = None
-        self.operation_thread = None
+        self._monitor_ticks = 0
+        self._monitor_task = None
+        self._iso_validation_cache = {}
+        self._log_buffer = deque()
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._system_info_str = None
+        self._pending_progress = None
+        self.settings = QSettings("Detorrent", "QuantumInterface")
+        self._last_iso_dir = self.settings.value("last_iso_dir", str(Path.home()), type=str)
+        self._last_backup_dir = self.settings.value("last_backup_dir", str(Path.home()), type=str)
         
         self.init_ui()
         self.setup_connections()
@@ -42,6 +132,7 @@ class QuantumInterface(QMainWindow):
         splitter.addWidget(right_panel)
         splitter.setSizes([400, 1000])
         
+        self.setStyleSheet(_INTERFACE_QSS)
         self.apply_dark_theme()
         
     def create_left_panel(self) -> QWidget:
@@ -103,19 +194,28 @@ class QuantumInterface(QMainWindow):
         tab_widget = QTabWidget()
         
         operation_tab = self.create_operation_tab()
-        backup_tab = self.create_backup_tab()
-        monitor_tab = self.create_monitor_tab()
-        settings_tab = self.create_settings_tab()
-        
         tab_widget.addTab(operation_tab, "OS Switch")
-        tab_widget.addTab(backup_tab, "Backup")
-        tab_widget.addTab(monitor_tab, "Monitor")
-        tab_widget.addTab(settings_tab, "Settings")
+        
+        self._lazy_tabs = {}
+        for title, builder in (("Backup", self.create_backup_tab), 
+                               ("Monitor", self.create_monitor_tab), 
+                               ("Settings", self.create_settings_tab)):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._lazy_tabs[tab_widget.addTab(placeholder, title)] = (placeholder, builder)
+        
+        tab_widget.currentChanged.connect(self.build_tab)
         
         layout.addWidget(tab_widget)
         
         return panel
         
+    def build_tab(self, index):
+        lazy_tab = self._lazy_tabs.pop(index, None)
+        if lazy_tab is not None:
+            placeholder, builder = lazy_tab
+            placeholder.layout().addWidget(builder())
+        
     def create_operation_tab(self) -> QWidget:
         tab = QWidget()
         layout = QVBoxLayout(tab)
@@ -133,7 +233,7 @@ class QuantumInterface(QMainWindow):
         operation_layout.addWidget(self.auto_reboot_checkbox)
         
         self.execute_btn = QPushButton("Execute OS Switch")
-        self.execute_btn.setStyleSheet("QPushButton { background-color: #e74c3c; color: white; font-weight: bold; padding: 10px; }")
+        self.execute_btn.setObjectName("execute")
         self.execute_btn.clicked.connect(self.execute_os_switch)
         
         operation_layout.addWidget(self.execute_btn)
@@ -160,6 +260,12 @@ class QuantumInterface(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(300)
+        self.log_cursor = QTextCursor(self.log_text.document())
+        
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(_LOG_FLUSH_MS)
+        self.log_flush_timer.timeout.connect(self.flush_log)
         
         log_layout.addWidget(self.log_text)
         
@@ -174,26 +280,26 @@ class QuantumInterface(QMainWindow):
         backup_group = QGroupBox("Backup Operations")
         backup_layout = QVBoxLayout(backup_group)
         
-        create_backup_btn = QPushButton("Create System Backup")
-        create_backup_btn.clicked.connect(self.create_backup)
+        self.create_backup_btn = QPushButton("Create System Backup")
+        self.create_backup_btn.clicked.connect(self.create_backup)
         
-        restore_backup_btn = QPushButton("Restore from Backup")
-        restore_backup_btn.clicked.connect(self.restore_backup)
+        self.restore_backup_btn = QPushButton("Restore from Backup")
+        self.restore_backup_btn.clicked.connect(self.restore_backup)
         
-        backup_layout.addWidget(create_backup_btn)
-        backup_layout.addWidget(restore_backup_btn)
+        backup_layout.addWidget(self.create_backup_btn)
+        backup_layout.addWidget(self.restore_backup_btn)
         
         layout.addWidget(backup_group)
         
         backup_list_group = QGroupBox("Available Backups")
         backup_list_layout = QVBoxLayout(backup_list_group)
         
-        refresh_backups_btn = QPushButton("Refresh Backup List")
-        refresh_backups_btn.clicked.connect(self.refresh_backups)
+        self.refresh_backups_btn = QPushButton("Refresh Backup List")
+        self.refresh_backups_btn.clicked.connect(self.refresh_backups)
         
         self.backup_list = QListWidget()
         
-        backup_list_layout.addWidget(refresh_backups_btn)
+        backup_list_layout.addWidget(self.refresh_backups_btn)
         backup_list_layout.addWidget(self.backup_list)
         
         layout.addWidget(backup_list_group)
@@ -247,7 +353,10 @@ class QuantumInterface(QMainWindow):
         settings_layout = QVBoxLayout(settings_group)
         
         self.theme_combo = QComboBox()
+        self.theme_combo.blockSignals(True)
         self.theme_combo.addItems(["Dark", "Light", "Auto"])
+        self.theme_combo.setCurrentIndex(0)
+        self.theme_combo.blockSignals(False)
         self.theme_combo.currentTextChanged.connect(self.change_theme)
         
         self.language_combo = QComboBox()
@@ -276,55 +385,66 @@ class QuantumInterface(QMainWindow):
         self.iso_list.itemClicked.connect(self.on_iso_selected)
         self.partition_list.itemClicked.connect(self.on_partition_selected)
         
-        self.monitor_timer = QTimer()
-        self.monitor_timer.timeout.connect(self.update_monitoring)
+        self.validation_timer = QTimer(self)
+        self.validation_timer.setSingleShot(True)
+        self.validation_timer.setInterval(_VALIDATION_DEBOUNCE_MS)
+        self.validation_timer.timeout.connect(self.validate_iso)
+        
+        self.ui_flush_timer = QTimer(self)
+        self.ui_flush_timer.setSingleShot(True)
+        self.ui_flush_timer.setInterval(_UI_FLUSH_MS)
+        self.ui_flush_timer.timeout.connect(self.flush_ui)
         
     def apply_dark_theme(self):
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(0, 0, 0))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-        palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-        
-        self.setPalette(palette)
+        self.setPalette(_dark_palette())
+        
+    def apply_light_theme(self):
+        self.setPalette(_light_palette())
         
     def browse_iso(self):
-        file_dialog = QFileDialog()
-        file_dialog.setNameFilter("ISO Files (*.iso *.img *.dmg *.vdi *.vmdk)")
-        file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-        
-        if file_dialog.exec():
-            selected_files = file_dialog.selectedFiles()
-            if selected_files:
-                self.iso_path_edit.setText(selected_files[0])
-                self.current_iso_path = selected_files[0]
-                self.validate_iso()
+        iso_path, _ = QFileDialog.getOpenFileName(self, "Select ISO", self._last_iso_dir, _ISO_FILE_FILTER)
+        if iso_path:
+            self.remember_iso_dir(os.path.dirname(iso_path))
+            self.iso_path_edit.setText(iso_path)
+            self.current_iso_path = iso_path
+            self.validate_iso()
                 
-    def scan_directory(self):
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory to Scan")
+    @asyncSlot()
+    async def scan_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, "Select Directory to Scan", self._last_iso_dir)
         if directory:
+            self.remember_iso_dir(directory)
             self.log_message(f"Scanning directory: {directory}")
-            iso_files = self.engine.scan_available_isos(directory)
+            iso_files = await _to_thread(self.engine.scan_available_isos, directory)
+            iso_files.sort(key=lambda iso_file: iso_file['name'].lower())
             
-            self.iso_list.clear()
-            for iso_file in iso_files:
-                item = QListWidgetItem(iso_file['name'])
-                item.setData(Qt.ItemDataRole.UserRole, iso_file['path'])
-                self.iso_list.addItem(item)
+            self.populate_list(self.iso_list, [(iso_file['name'], iso_file['path']) for iso_file in iso_files])
                 
-    def validate_iso(self):
+    def remember_iso_dir(self, directory):
+        self._last_iso_dir = directory
+        self.settings.setValue("last_iso_dir", directory)
+        
+    def remember_backup_dir(self, directory):
+        self._last_backup_dir = directory
+        self.settings.setValue("last_backup_dir", directory)
+        
+    @asyncSlot()
+    async def validate_iso(self):
         if self.current_iso_path:
-            self.log_message(f"Validating ISO: {self.current_iso_path}")
-            validation_result = self.engine.validate_iso(self.current_iso_path)
+            iso_path = self.current_iso_path
+            self.log_message(f"Validating ISO: {iso_path}")
+            
+            try:
+                stat_info = os.stat(iso_path)
+                cache_key = (iso_path, stat_info.st_mtime_ns, stat_info.st_size)
+            except OSError:
+                cache_key = None
+            
+            validation_result = self._iso_validation_cache.get(cache_key)
+            if validation_result is None:
+                validation_result = await _to_thread(self.engine.validate_iso, iso_path)
+                if cache_key is not None:
+                    self._iso_validation_cache[cache_key] = validation_result
             
             if validation_result['valid']:
                 self.log_message("ISO validation successful")
@@ -332,31 +452,37 @@ class QuantumInterface(QMainWindow):
                 self.log_message(f"ISO validation failed: {validation_result['error']}")
                 QMessageBox.warning(self, "Validation Error", f"ISO validation failed: {validation_result['error']}")
                 
-    def refresh_partitions(self):
+    @asyncSlot()
+    async def refresh_partitions(self):
         self.log_message("Refreshing partition list...")
-        partitions = self.engine.partition_manager.list_partitions()
+        partitions = await _to_thread(self.engine.partition_manager.list_partitions)
         
-        self.partition_list.clear()
-        for partition in partitions:
-            if 'error' not in partition:
-                if os.name == 'nt':
-                    item_text = f"Partition {partition['number']} ({partition['letter']}) - {partition['size']} bytes"
-                else:
-                    item_text = f"{partition['name']} - {partition['size']} ({partition['fstype']})"
-                
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.ItemDataRole.UserRole, partition)
-                self.partition_list.addItem(item)
+        self.populate_list(self.partition_list, [
+            (_partition_label(partition), partition) for partition in partitions if 'error' not in partition
+        ])
                 
+    def populate_list(self, list_widget: QListWidget, entries):
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            list_widget.addItems([text for text, _ in entries])
+            for row, (_, data) in enumerate(entries):
+                list_widget.item(row).setData(Qt.ItemDataRole.UserRole, data)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+        
     def on_iso_selected(self, item):
         self.current_iso_path = item.data(Qt.ItemDataRole.UserRole)
         self.iso_path_edit.setText(self.current_iso_path)
-        self.validate_iso()
+        self.validation_timer.start()
         
     def on_partition_selected(self, item):
         self.current_partition = item.data(Qt.ItemDataRole.UserRole)
         
-    def execute_os_switch(self):
+    @asyncSlot()
+    async def execute_os_switch(self):
         if not self.current_iso_path:
             QMessageBox.warning(self, "Error", "Please select an ISO file")
             return
@@ -370,31 +496,65 @@ class QuantumInterface(QMainWindow):
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.start_os_switch_operation()
+            await self.start_os_switch_operation()
             
-    def start_os_switch_operation(self):
+    async def start_os_switch_operation(self):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.execute_btn.setEnabled(False)
         
         preserve_data = self.preserve_data_checkbox.isChecked()
         
-        if os.name == 'nt':
+        if _IS_NT:
             target_partition = self.current_partition['letter']
         else:
             target_partition = self.current_partition['name']
         
-        self.operation_thread = OsSwitchThread(self.engine, self.current_iso_path, target_partition, preserve_data)
-        self.operation_thread.progress_updated.connect(self.update_progress)
-        self.operation_thread.operation_completed.connect(self.operation_completed)
-        self.operation_thread.start()
+        try:
+            loop = asyncio.get_running_loop()
+            progress_queue = asyncio.Queue()
+            
+            def report_progress(progress, message):
+                loop.call_soon_threadsafe(progress_queue.put_nowait, (progress, message))
+            
+            operation = asyncio.ensure_future(_to_thread(self.engine.execute_os_switch, self.current_iso_path, 
+                                                         target_partition, preserve_data, report_progress))
+            operation.add_done_callback(lambda _: progress_queue.put_nowait(None))
+            
+            while True:
+                update = await progress_queue.get()
+                if update is None:
+                    break
+                self.update_progress(*update)
+            
+            result = await operation
+            
+            if result['success']:
+                self.operation_completed(True, result['message'])
+            else:
+                self.operation_completed(False, result['error'])
+                
+        except Exception as e:
+            self.operation_completed(False, str(e))
         
     def update_progress(self, progress, message):
+        self._pending_progress = (progress, message)
+        self.log_message(message)
+        if not self.ui_flush_timer.isActive():
+            self.ui_flush_timer.start()
+            
+    def flush_ui(self):
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is None:
+            return
+        
+        progress, message = pending
         self.progress_bar.setValue(progress)
         self.status_label.setText(message)
-        self.log_message(message)
         
     def operation_completed(self, success, message):
+        self.ui_flush_timer.stop()
+        self._pending_progress = None
         self.progress_bar.setVisible(False)
         self.execute_btn.setEnabled(True)
         
@@ -405,11 +565,14 @@ class QuantumInterface(QMainWindow):
             self.status_label.setText("Operation failed")
             QMessageBox.critical(self, "Error", message)
             
-    def create_backup(self):
-        backup_path = QFileDialog.getExistingDirectory(self, "Select Backup Directory")
+    @asyncSlot()
+    async def create_backup(self):
+        backup_path = QFileDialog.getExistingDirectory(self, "Select Backup Directory", self._last_backup_dir)
         if backup_path:
+            self.remember_backup_dir(backup_path)
             self.log_message(f"Creating backup in: {backup_path}")
-            result = self.engine.create_backup(backup_path)
+            with self.buttons_disabled(self.create_backup_btn, self.restore_backup_btn):
+                result = await _to_thread(self.engine.create_backup, backup_path)
             
             if result['success']:
                 self.log_message("Backup created successfully")
@@ -418,16 +581,19 @@ class QuantumInterface(QMainWindow):
                 self.log_message(f"Backup failed: {result['error']}")
                 QMessageBox.critical(self, "Error", f"Backup failed: {result['error']}")
                 
-    def restore_backup(self):
-        backup_path = QFileDialog.getExistingDirectory(self, "Select Backup Directory")
+    @asyncSlot()
+    async def restore_backup(self):
+        backup_path = QFileDialog.getExistingDirectory(self, "Select Backup Directory", self._last_backup_dir)
         if backup_path:
+            self.remember_backup_dir(backup_path)
             reply = QMessageBox.question(self, "Confirm Restore", 
                                        "Are you sure you want to restore from backup? This will overwrite current system data.",
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.log_message(f"Restoring from backup: {backup_path}")
-                result = self.engine.restore_backup(backup_path)
+                with self.buttons_disabled(self.create_backup_btn, self.restore_backup_btn):
+                    result = await _to_thread(self.engine.restore_backup, backup_path)
                 
                 if result['success']:
                     self.log_message("Backup restored successfully")
@@ -436,35 +602,67 @@ class QuantumInterface(QMainWindow):
                     self.log_message(f"Restore failed: {result['error']}")
                     QMessageBox.critical(self, "Error", f"Restore failed: {result['error']}")
                     
-    def refresh_backups(self):
-        backup_directory = QFileDialog.getExistingDirectory(self, "Select Backup Directory")
+    @asyncSlot()
+    async def refresh_backups(self):
+        backup_directory = QFileDialog.getExistingDirectory(self, "Select Backup Directory", self._last_backup_dir)
         if backup_directory:
-            backups = self.engine.backup_manager.list_backups(backup_directory)
+            self.remember_backup_dir(backup_directory)
+            with self.buttons_disabled(self.refresh_backups_btn):
+                backups = await _to_thread(self.engine.backup_manager.list_backups, backup_directory)
             
-            self.backup_list.clear()
-            for backup in backups:
-                if 'error' not in backup:
-                    item_text = f"{backup['name']} - {backup['size']} bytes ({backup['created']})"
-                    item = QListWidgetItem(item_text)
-                    item.setData(Qt.ItemDataRole.UserRole, backup['path'])
-                    self.backup_list.addItem(item)
+            self.populate_list(self.backup_list, [
+                (f"{backup['name']} - {backup['size']} bytes ({backup['created']})", backup['path'])
+                for backup in backups if 'error' not in backup
+            ])
+                    
+    @contextlib.contextmanager
+    def buttons_disabled(self, *buttons):
+        for button in buttons:
+            button.setEnabled(False)
+        try:
+            yield
+        finally:
+            for button in buttons:
+                button.setEnabled(True)
                     
     def start_monitoring(self):
-        self.monitor_timer.start(1000)
+        if self._monitor_task is not None and not self._monitor_task.done():
+            return
+        
+        self.engine.system_monitor.start_monitoring(_MONITOR_INTERVAL_MS / 1000)
+        self._monitor_ticks = 0
+        self._monitor_task = asyncio.ensure_future(self._monitor_loop())
         self.log_message("System monitoring started")
         
-    def stop_monitoring(self):
-        self.monitor_timer.stop()
+    @asyncSlot()
+    async def stop_monitoring(self):
+        task, self._monitor_task = self._monitor_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        
+        self.engine.system_monitor.stop_monitoring()
         self.log_message("System monitoring stopped")
         
-    def update_monitoring(self):
-        metrics = self.engine.system_monitor.get_current_metrics()
+    async def _monitor_loop(self):
+        while True:
+            await self.update_monitoring()
+            await asyncio.sleep(_MONITOR_INTERVAL_MS / 1000)
+        
+    async def update_monitoring(self):
+        metrics = await _to_thread(self.engine.system_monitor.get_current_metrics)
         
         if 'error' not in metrics:
             self.cpu_label.setText(f"CPU Usage: {metrics['cpu_percent']:.1f}%")
             self.memory_label.setText(f"Memory Usage: {metrics['memory_percent']:.1f}%")
             
-            health = self.engine.system_monitor.get_system_health()
+            tick = self._monitor_ticks
+            self._monitor_ticks += 1
+            if tick % _HEALTH_CHECK_TICKS:
+                return
+            
+            health = await _to_thread(self.engine.system_monitor.get_system_health)
             if 'error' not in health:
                 health_text = f"Overall Status: {health['overall']}\n"
                 if health['issues']:
@@ -478,46 +676,39 @@ class QuantumInterface(QMainWindow):
         if theme_name == "Dark":
             self.apply_dark_theme()
         elif theme_name == "Light":
-            self.setStyleSheet("")
+            self.apply_light_theme()
         self.log_message(f"Theme changed to: {theme_name}")
         
-    def load_system_info(self):
-        system_info = self.engine.get_system_info()
-        
-        if 'error' not in system_info:
-            info_text = f"Platform: {system_info['platform']['system']}\n"
-            info_text += f"Version: {system_info['platform']['version']}\n"
-            info_text += f"Architecture: {system_info['platform']['architecture']}\n"
-            info_text += f"Hostname: {system_info['platform']['hostname']}\n"
+    @asyncSlot()
+    async def load_system_info(self):
+        if self._system_info_str is None:
+            platform_info = await _to_thread(self.engine.get_platform_info)
+            if 'error' in platform_info:
+                return
             
-            self.system_info_text.setText(info_text)
+            self._system_info_str = (
+                f"Platform: {platform_info['system']}\n"
+                f"Version: {platform_info['version']}\n"
+                f"Architecture: {platform_info['architecture']}\n"
+                f"Hostname: {platform_info['hostname']}\n"
+            )
+        
+        self.system_info_text.setPlainText(self._system_info_str)
             
     def log_message(self, message):
-        timestamp = QTimer().remainingTime()
-        self.log_text.append(f"[{timestamp}] {message}")
-
-class OsSwitchThread(QThread):
-    progress_updated = pyqtSignal(int, str)
-    operation_completed = pyqtSignal(bool, str)
-    
-    def __init__(self, engine, iso_path, target_partition, preserve_data):
-        super().__init__()
-        self.engine = engine
-        self.iso_path = iso_path
-        self.target_partition = target_partition
-        self.preserve_data = preserve_data
-        
-    def run(self):
-        try:
-            self.progress_updated.emit(10, "Preparing OS switch operation...")
-            
-            result = self.engine.execute_os_switch(self.iso_path, self.target_partition, self.preserve_data)
+        self._log_buffer.append(f"[{self._elapsed.elapsed():>9d}] {message}\n")
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
             
-            if result['success']:
-                self.progress_updated.emit(100, "OS switch completed successfully")
-                self.operation_completed.emit(True, result['message'])
-            else:
-                self.operation_completed.emit(False, result['error'])
-                
-        except Exception as e:
-            self.operation_completed.emit(False, str(e))
+    def flush_log(self):
+        if not self._log_buffer:
+            return
+        
+        text = ''.join(self._log_buffer)
+        self._log_buffer.clear()
+        
+        self.log_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self.log_cursor.insertText(text)
+        
+        scroll_bar = self.log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
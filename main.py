@@ -1,17 +1,22 @@
 import sys
 import os
+import asyncio
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool
+import qasync
 from core.nexus_engine import NexusEngine
 from gui.quantum_interface import QuantumInterface
 from utils.system_validator import SystemValidator
 
+_MAX_WORKER_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
 class DetorrentLauncher:
     def __init__(self):
         self.application = QApplication(sys.argv)
         self.application.setApplicationName("Detorrent")
         self.application.setApplicationVersion("1.0.0")
+        QThreadPool.globalInstance().setMaxThreadCount(_MAX_WORKER_THREADS)
         
     def initialize_system(self):
         validator = SystemValidator()
@@ -26,10 +31,22 @@ class DetorrentLauncher:
         return True
     
     def launch_interface(self):
+        loop = qasync.QEventLoop(self.application)
+        asyncio.set_event_loop(loop)
+        
+        with loop:
+            return loop.run_until_complete(self.run_interface())
+    
+    async def run_interface(self) -> int:
+        app_close_event = asyncio.Event()
+        self.application.aboutToQuit.connect(app_close_event.set)
+        
         engine = NexusEngine()
         interface = QuantumInterface(engine)
         interface.show()
-        return self.application.exec()
+        
+        await app_close_event.wait()
+        return 0
 
 if __name__ == "__main__":
     launcher = DetorrentLauncher()
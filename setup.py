@@ -8,7 +8,8 @@ setup(
     packages=find_packages(),
     install_requires=[
         "PyQt6>=6.5.0",
-        "psutil>=5.9.0"
+        "psutil>=5.9.0",
+        "qasync>=0.24.0"
     ],
     python_requires=">=3.8",
     entry_points={
@@ -1,280 +1,378 @@
 import os
-import subprocess
+import re
+import sys
+import shutil
 import platform
 import ctypes
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_PLATFORM = platform.system()
+_IS_WINDOWS = os.name == 'nt'
+_SUPPORTED_PLATFORMS = ('Windows', 'Linux', 'Darwin')
+_REQUIRED_PYTHON = (3, 8)
+_REQUIRED_TOOLS = ('powershell', 'diskpart') if _IS_WINDOWS else ('mount', 'umount', 'parted', 'mkfs')
+_MIN_MEMORY_GB = 4
+_MIN_DISK_GB = 10
+_MIN_DISK_BYTES = _MIN_DISK_GB * (1 << 30)
+_DISK_ROOT = 'C:\\' if _IS_WINDOWS else '/'
+_DISK_SPACE_TTL = 1.0
+_HAS_STATVFS = hasattr(os, 'statvfs')
+_SIZE_RE = re.compile(r'\s*(\d+(?:\.\d+)?|\.\d+)\s*([kmgtKMGT]?)')
+_UNIT_GB = {'k': 2**-20, 'm': 2**-10, 'g': 1.0, 't': 1024.0, '': 2**-30}
+_SUPPORTED_EXT = frozenset(('.iso', '.img', '.dmg', '.vdi', '.vmdk'))
+_MIN_ISO_SIZE = 100 * 1024 * 1024
+_MIN_PARTITION_GB = 5
+_MIN_PARTITION_BYTES = _MIN_PARTITION_GB << 30
+_WINDOWS_PARTITION_FIELDS = frozenset(('number', 'size', 'type'))
+_UNIX_PARTITION_FIELDS = frozenset(('name', 'size', 'fstype'))
+_RECOMMENDATIONS = (
+    ('iso_compatible', "Verify ISO file integrity and format"),
+    ('system_ready', "Check system compatibility requirements"),
+    ('privileges_ok', "Run application with administrator privileges")
+)
+
+@lru_cache(maxsize=1)
+def _platform_support() -> Dict:
+    return {
+        'supported': _PLATFORM in _SUPPORTED_PLATFORMS,
+        'platform': _PLATFORM
+    }
+
+_PY_OK = sys.version_info[:2] >= _REQUIRED_PYTHON
+_PY_REPORT = {
+    'supported': _PY_OK,
+    'version': f"{sys.version_info[0]}.{sys.version_info[1]}",
+    'required': f"{_REQUIRED_PYTHON[0]}.{_REQUIRED_PYTHON[1]}"
+}
+
+@lru_cache(maxsize=1)
+def _required_tools() -> Dict:
+    available_tools = []
+    missing_tools = []
+    
+    for tool in _REQUIRED_TOOLS:
+        if shutil.which(tool) is not None:
+            available_tools.append(tool)
+        else:
+            missing_tools.append(tool)
+    
+    return {
+        'available': available_tools,
+        'missing': missing_tools,
+        'supported': len(missing_tools) == 0
+    }
+
+class _MemoryStatusEx(ctypes.Structure):
+    _fields_ = [
+        ('dwLength', ctypes.c_ulong),
+        ('dwMemoryLoad', ctypes.c_ulong),
+        ('ullTotalPhys', ctypes.c_ulonglong),
+        ('ullAvailPhys', ctypes.c_ulonglong),
+        ('ullTotalPageFile', ctypes.c_ulonglong),
+        ('ullAvailPageFile', ctypes.c_ulonglong),
+        ('ullTotalVirtual', ctypes.c_ulonglong),
+        ('ullAvailVirtual', ctypes.c_ulonglong),
+        ('ullAvailExtendedVirtual', ctypes.c_ulonglong)
+    ]
+
+def _windows_total_memory() -> Optional[int]:
+    status = _MemoryStatusEx()
+    status.dwLength = ctypes.sizeof(_MemoryStatusEx)
+    if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        return status.ullTotalPhys
+    return None
+
+def _proc_total_memory() -> Optional[int]:
+    try:
+        with open('/proc/meminfo', 'rb') as f:
+            fields = f.readline().split()
+    except OSError:
+        return None
+    
+    if len(fields) >= 2 and fields[0] == b'MemTotal:':
+        return int(fields[1]) * 1024
+    return None
+
+@lru_cache(maxsize=1)
+def _total_memory_bytes() -> Optional[int]:
+    if _IS_WINDOWS:
+        total = _windows_total_memory()
+    else:
+        total = _proc_total_memory()
+        if total is None and hasattr(os, 'sysconf'):
+            try:
+                total = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+            except (ValueError, OSError):
+                total = None
+    
+    if total is None and psutil is not None:
+        total = psutil.virtual_memory().total
+    return total
+
+@lru_cache(maxsize=1)
+def _memory_requirements() -> Dict:
+    total_bytes = _total_memory_bytes()
+    if total_bytes is None:
+        return {
+            'available_gb': None,
+            'required_gb': _MIN_MEMORY_GB,
+            'supported': False
+        }
+    
+    available_memory_gb = total_bytes / (1024**3)
+    
+    return {
+        'available_gb': available_memory_gb,
+        'required_gb': _MIN_MEMORY_GB,
+        'supported': available_memory_gb >= _MIN_MEMORY_GB
+    }
+
+if _IS_WINDOWS:
+    _is_user_an_admin = ctypes.windll.shell32.IsUserAnAdmin
+    _is_user_an_admin.restype = ctypes.c_int
+else:
+    _is_user_an_admin = None
+
+def _free_disk_bytes(path: str) -> int:
+    if _HAS_STATVFS:
+        stat = os.statvfs(path)
+        return stat.f_bavail * stat.f_frsize
+    return shutil.disk_usage(path).free
+
+@dataclass
+class ValidationReport:
+    platform: Optional[Dict] = None
+    python: Optional[Dict] = None
+    tools: Optional[Dict] = None
+    disk_space: Optional[Dict] = None
+    memory: Optional[Dict] = None
+
 class SystemValidator:
     def __init__(self):
-        self.validation_results = {}
+        self.validation_results = ValidationReport()
+        self._iso_cache = {}
+        self._disk_space = None
+        self._disk_space_checked = 0.0
+        self._is_admin = self._validate_windows_privileges() if _IS_WINDOWS else self._validate_unix_privileges()
         
     def validate_privileges(self) -> bool:
-        try:
-            if os.name == 'nt':
-                return self._validate_windows_privileges()
-            else:
-                return self._validate_unix_privileges()
-        except Exception:
-            return False
+        return self._is_admin
     
     def _validate_windows_privileges(self) -> bool:
         try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except Exception:
+            return bool(_is_user_an_admin())
+        except OSError:
             return False
     
     def _validate_unix_privileges(self) -> bool:
-        try:
-            return os.geteuid() == 0
-        except Exception:
-            return False
+        return os.geteuid() == 0
     
     def validate_system_compatibility(self) -> bool:
-        try:
-            compatibility_checks = [
-                self._check_platform_support(),
-                self._check_python_version(),
-                self._check_required_tools(),
-                self._check_disk_space(),
-                self._check_memory_requirements()
-            ]
-            
-            return all(compatibility_checks)
-        except Exception:
-            return False
+        compatibility_checks = [
+            self._check_platform_support(),
+            self._check_python_version(),
+            self._check_required_tools(),
+            self._check_disk_space(),
+            self._check_memory_requirements()
+        ]
+        
+        return all(compatibility_checks)
     
     def _check_platform_support(self) -> bool:
-        try:
-            supported_platforms = ['Windows', 'Linux', 'Darwin']
-            current_platform = platform.system()
-            
-            self.validation_results['platform'] = {
-                'supported': current_platform in supported_platforms,
-                'platform': current_platform
-            }
-            
-            return current_platform in supported_platforms
-        except Exception:
-            return False
+        result = _platform_support()
+        self.validation_results.platform = result
+        return result['supported']
     
     def _check_python_version(self) -> bool:
-        try:
-            import sys
-            required_version = (3, 8)
-            current_version = sys.version_info[:2]
-            
-            self.validation_results['python'] = {
-                'supported': current_version >= required_version,
-                'version': f"{current_version[0]}.{current_version[1]}",
-                'required': f"{required_version[0]}.{required_version[1]}"
-            }
-            
-            return current_version >= required_version
-        except Exception:
-            return False
+        self.validation_results.python = _PY_REPORT
+        return _PY_OK
     
     def _check_required_tools(self) -> bool:
-        try:
-            required_tools = []
-            
-            if os.name == 'nt':
-                required_tools = ['powershell', 'diskpart']
-            else:
-                required_tools = ['mount', 'umount', 'parted', 'mkfs']
-            
-            available_tools = []
-            missing_tools = []
-            
-            for tool in required_tools:
-                try:
-                    result = subprocess.run([tool, '--version'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0 or result.returncode == 1:
-                        available_tools.append(tool)
-                    else:
-                        missing_tools.append(tool)
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    missing_tools.append(tool)
-            
-            self.validation_results['tools'] = {
-                'available': available_tools,
-                'missing': missing_tools,
-                'supported': len(missing_tools) == 0
-            }
-            
-            return len(missing_tools) == 0
-        except Exception:
-            return False
+        result = _required_tools()
+        self.validation_results.tools = result
+        return result['supported']
     
     def _check_disk_space(self) -> bool:
-        try:
-            import shutil
-            
-            min_space_gb = 10
-            available_space_gb = shutil.disk_usage('/').free / (1024**3)
-            
-            if os.name == 'nt':
-                available_space_gb = shutil.disk_usage('C:').free / (1024**3)
-            
-            self.validation_results['disk_space'] = {
-                'available_gb': available_space_gb,
-                'required_gb': min_space_gb,
-                'supported': available_space_gb >= min_space_gb
+        now = time.monotonic()
+        if self._disk_space is None or now - self._disk_space_checked >= _DISK_SPACE_TTL:
+            try:
+                free_bytes = _free_disk_bytes(_DISK_ROOT)
+            except OSError:
+                return False
+            
+            self._disk_space = {
+                'available_gb': free_bytes / (1024**3),
+                'required_gb': _MIN_DISK_GB,
+                'supported': free_bytes >= _MIN_DISK_BYTES
             }
-            
-            return available_space_gb >= min_space_gb
-        except Exception:
-            return False
+            self._disk_space_checked = now
+        
+        self.validation_results.disk_space = self._disk_space
+        return self._disk_space['supported']
     
     def _check_memory_requirements(self) -> bool:
         try:
-            import psutil
-            
-            min_memory_gb = 4
-            available_memory_gb = psutil.virtual_memory().total / (1024**3)
-            
-            self.validation_results['memory'] = {
-                'available_gb': available_memory_gb,
-                'required_gb': min_memory_gb,
-                'supported': available_memory_gb >= min_memory_gb
-            }
-            
-            return available_memory_gb >= min_memory_gb
-        except Exception:
+            result = _memory_requirements()
+        except OSError:
             return False
+        
+        self.validation_results.memory = result
+        return result['supported']
     
     def validate_iso_compatibility(self, iso_path: str) -> Dict:
         try:
-            if not os.path.exists(iso_path):
-                return {'compatible': False, 'error': 'ISO file does not exist'}
-            
-            file_size = os.path.getsize(iso_path)
-            min_size_mb = 100
-            
-            if file_size < min_size_mb * 1024 * 1024:
-                return {'compatible': False, 'error': 'ISO file too small'}
-            
-            file_extension = os.path.splitext(iso_path)[1].lower()
-            supported_extensions = ['.iso', '.img', '.dmg', '.vdi', '.vmdk']
-            
-            if file_extension not in supported_extensions:
-                return {'compatible': False, 'error': 'Unsupported file format'}
-            
-            return {
-                'compatible': True,
-                'size_mb': file_size / (1024 * 1024),
-                'format': file_extension
-            }
-            
-        except Exception as e:
+            stat_info = os.stat(iso_path)
+        except FileNotFoundError:
+            return {'compatible': False, 'error': 'ISO file does not exist'}
+        except OSError as e:
             return {'compatible': False, 'error': str(e)}
+        
+        return self._cached_iso_result(iso_path, stat_info)
+    
+    def validate_iso_compatibility_batch(self, iso_paths: List[str]) -> Dict[str, Dict]:
+        paths_by_directory = {}
+        for iso_path in iso_paths:
+            paths_by_directory.setdefault(os.path.dirname(iso_path), []).append(iso_path)
+        
+        results = {}
+        for directory, paths in paths_by_directory.items():
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    entries_by_name = {entry.name: entry for entry in entries}
+            except OSError:
+                entries_by_name = {}
+            
+            for iso_path in paths:
+                entry = entries_by_name.get(os.path.basename(iso_path))
+                if entry is None:
+                    results[iso_path] = self.validate_iso_compatibility(iso_path)
+                    continue
+                
+                try:
+                    stat_info = entry.stat()
+                except FileNotFoundError:
+                    results[iso_path] = {'compatible': False, 'error': 'ISO file does not exist'}
+                except OSError as e:
+                    results[iso_path] = {'compatible': False, 'error': str(e)}
+                else:
+                    results[iso_path] = self._cached_iso_result(iso_path, stat_info)
+        
+        return results
+    
+    def _cached_iso_result(self, iso_path: str, stat_info: os.stat_result) -> Dict:
+        key = (iso_path, stat_info.st_mtime_ns, stat_info.st_size)
+        cached = self._iso_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        self._iso_cache[key] = result = self._check_iso_file(iso_path, stat_info.st_size)
+        return result
+    
+    def _check_iso_file(self, iso_path: str, file_size: int) -> Dict:
+        if file_size < _MIN_ISO_SIZE:
+            return {'compatible': False, 'error': 'ISO file too small'}
+        
+        file_extension = os.path.splitext(iso_path)[1].lower()
+        
+        if file_extension not in _SUPPORTED_EXT:
+            return {'compatible': False, 'error': 'Unsupported file format'}
+        
+        return {
+            'compatible': True,
+            'size_mb': file_size / (1024 * 1024),
+            'format': file_extension
+        }
     
     def validate_partition_compatibility(self, partition_info: Dict) -> Dict:
-        try:
-            if os.name == 'nt':
-                return self._validate_windows_partition(partition_info)
-            else:
-                return self._validate_unix_partition(partition_info)
-        except Exception as e:
-            return {'compatible': False, 'error': str(e)}
+        if _IS_WINDOWS:
+            return self._validate_windows_partition(partition_info)
+        else:
+            return self._validate_unix_partition(partition_info)
+    
+    def _missing_fields_error(self, partition_info: Dict, required_fields: frozenset) -> Optional[Dict]:
+        if partition_info.keys() >= required_fields:
+            return None
+        
+        missing = ', '.join(sorted(required_fields - partition_info.keys()))
+        return {'compatible': False, 'error': f'Missing fields: {missing}'}
     
     def _validate_windows_partition(self, partition_info: Dict) -> Dict:
-        try:
-            required_fields = ['number', 'size', 'type']
-            
-            for field in required_fields:
-                if field not in partition_info:
-                    return {'compatible': False, 'error': f'Missing field: {field}'}
-            
-            min_size_gb = 5
-            partition_size_gb = partition_info['size'] / (1024**3)
-            
-            if partition_size_gb < min_size_gb:
-                return {'compatible': False, 'error': 'Partition too small'}
-            
-            return {
-                'compatible': True,
-                'size_gb': partition_size_gb,
-                'type': partition_info['type']
-            }
-            
-        except Exception as e:
-            return {'compatible': False, 'error': str(e)}
+        error = self._missing_fields_error(partition_info, _WINDOWS_PARTITION_FIELDS)
+        if error:
+            return error
+        
+        size = partition_info['size']
+        if not isinstance(size, (int, float)):
+            return {'compatible': False, 'error': f'Invalid partition size: {size!r}'}
+        
+        if size < _MIN_PARTITION_BYTES:
+            return {'compatible': False, 'error': 'Partition too small'}
+        
+        return {
+            'compatible': True,
+            'size_gb': size / (1024**3),
+            'type': partition_info['type']
+        }
     
     def _validate_unix_partition(self, partition_info: Dict) -> Dict:
-        try:
-            required_fields = ['name', 'size', 'fstype']
-            
-            for field in required_fields:
-                if field not in partition_info:
-                    return {'compatible': False, 'error': f'Missing field: {field}'}
-            
-            min_size_gb = 5
-            partition_size_gb = self._parse_size_to_gb(partition_info['size'])
-            
-            if partition_size_gb < min_size_gb:
-                return {'compatible': False, 'error': 'Partition too small'}
-            
-            return {
-                'compatible': True,
-                'size_gb': partition_size_gb,
-                'fstype': partition_info['fstype']
-            }
-            
-        except Exception as e:
-            return {'compatible': False, 'error': str(e)}
+        error = self._missing_fields_error(partition_info, _UNIX_PARTITION_FIELDS)
+        if error:
+            return error
+        
+        partition_size_gb = self._parse_size_to_gb(partition_info['size'])
+        
+        if partition_size_gb < _MIN_PARTITION_GB:
+            return {'compatible': False, 'error': 'Partition too small'}
+        
+        return {
+            'compatible': True,
+            'size_gb': partition_size_gb,
+            'fstype': partition_info['fstype']
+        }
     
-    def _parse_size_to_gb(self, size_str: str) -> float:
-        try:
-            size_str = size_str.upper()
-            
-            if 'G' in size_str:
-                return float(size_str.replace('G', ''))
-            elif 'M' in size_str:
-                return float(size_str.replace('M', '')) / 1024
-            elif 'K' in size_str:
-                return float(size_str.replace('K', '')) / (1024 * 1024)
-            else:
-                return float(size_str) / (1024**3)
-                
-        except Exception:
+    def _parse_size_to_gb(self, size_str) -> float:
+        if isinstance(size_str, (int, float)):
+            return size_str / (1024**3)
+        
+        match = _SIZE_RE.match(size_str) if isinstance(size_str, str) else None
+        if not match:
             return 0.0
+        
+        return float(match.group(1)) * _UNIT_GB[match.group(2).lower()]
     
     def get_validation_report(self) -> Dict:
-        return self.validation_results.copy()
+        report = asdict(self.validation_results)
+        return {name: result for name, result in report.items() if result is not None}
     
     def validate_operation_safety(self, iso_path: str, target_partition: str) -> Dict:
         try:
-            safety_checks = {
-                'iso_compatible': self.validate_iso_compatibility(iso_path),
-                'system_ready': self.validate_system_compatibility(),
-                'privileges_ok': self.validate_privileges()
-            }
+            safety_checks = {'privileges_ok': self.validate_privileges()}
+            outcomes = {'privileges_ok': safety_checks['privileges_ok']}
+            all_safe = outcomes['privileges_ok']
             
-            all_safe = all(
-                check.get('compatible', False) or check.get('supported', False) or check
-                for check in safety_checks.values()
-            )
+            if all_safe:
+                all_safe = safety_checks['system_ready'] = outcomes['system_ready'] = self.validate_system_compatibility()
+            
+            if all_safe:
+                safety_checks['iso_compatible'] = self.validate_iso_compatibility(iso_path)
+                all_safe = outcomes['iso_compatible'] = safety_checks['iso_compatible'].get('compatible', False)
             
             return {
                 'safe_to_proceed': all_safe,
                 'checks': safety_checks,
-                'recommendations': self._generate_recommendations(safety_checks)
+                'recommendations': self._generate_recommendations(outcomes)
             }
             
         except Exception as e:
             return {'safe_to_proceed': False, 'error': str(e)}
     
-    def _generate_recommendations(self, safety_checks: Dict) -> List[str]:
-        recommendations = []
-        
-        if not safety_checks.get('iso_compatible', {}).get('compatible', False):
-            recommendations.append("Verify ISO file integrity and format")
-        
-        if not safety_checks.get('system_ready', False):
-            recommendations.append("Check system compatibility requirements")
-        
-        if not safety_checks.get('privileges_ok', False):
-            recommendations.append("Run application with administrator privileges")
-        
-        return recommendations
+    def _generate_recommendations(self, outcomes: Dict[str, bool]) -> List[str]:
+        return [message for key, message in _RECOMMENDATIONS if outcomes.get(key) is False]